@@ -15,7 +15,7 @@ from strands import Agent
 from strands_tools import current_time, python_repl, use_aws, retrieve
 
 # Import tools
-from shared.experiments import get_experiments, update_experiment
+from shared.experiments import get_experiments, update_experiment, update_experiments_status_batch
 from shared.analysis_results import get_resource_analysis
 from shared.config import get_aws_region
 from shared.resource_tags import get_workload_tags
@@ -52,6 +52,7 @@ agent = Agent(
         # Database tools
         get_experiments,
         update_experiment,
+        update_experiments_status_batch,
         
         # Analysis tools for accessing previous workload analysis
         get_resource_analysis,
@@ -20,7 +20,8 @@ from LearningAndIterationAgent.agents.analysis_agent.agent import analyze_experi
 from LearningAndIterationAgent.agents.iteration_agent.agent import refine_hypothesis, suggest_follow_up_experiments
 
 # Import shared database tools
-from shared.learning_insights import get_experiment_results, save_learning_insights, get_learning_history, update_hypothesis_status
+from shared.learning_insights import get_experiment_results, save_learning_insights, save_insights_and_update_hypothesis, get_learning_history, update_hypothesis_status
+from shared.experiments import get_experiments
 
 # Load system prompt
 current_file = Path(__file__)
@@ -37,8 +38,10 @@ agent = Agent(
         current_time,
         
         # Database tools for retrieving experiment data
+        get_experiments,
         get_experiment_results,
         save_learning_insights,
+        save_insights_and_update_hypothesis,
         get_learning_history,
         update_hypothesis_status,
         
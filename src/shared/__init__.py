@@ -1,11 +1,11 @@
 # Shared utilities for Chaos Agent System
 
 # Import all tools for easy access
-from .experiments import insert_experiment, get_experiments, update_experiment
+from .experiments import insert_experiment, get_experiments, update_experiment, update_experiments_status_batch
 from .hypotheses import insert_hypothesis, update_hypothesis, get_hypotheses, batch_update_hypothesis_priorities, batch_insert_hypotheses
 from .system_components import insert_system_component, update_system_component, get_system_components, batch_insert_system_components
 from .views import get_experiments_with_context
-from .learning_insights import save_learning_insights, get_learning_history, update_hypothesis_status, get_experiment_results
+from .learning_insights import save_learning_insights, save_insights_and_update_hypothesis, get_learning_history, update_hypothesis_status, get_experiment_results
 
 from .config import get_aws_region
 from .resource_tags import get_workload_tags, set_workload_tags_from_string
@@ -15,6 +15,7 @@ __all__ = [
     # Experiment tools
     'insert_experiment',
     'get_experiments', 
+    'update_experiments_status_batch',
     'update_experiment',
     # Hypothesis tools
     'insert_hypothesis',
@@ -31,6 +32,7 @@ __all__ = [
     'get_experiments_with_context',
     # Learning insights tools
     'save_learning_insights',
+    'save_insights_and_update_hypothesis',
     'get_learning_history',
     'update_hypothesis_status',
     'get_experiment_results',
@@ -8,6 +8,7 @@ import os
 import boto3
 import logging
 from typing import Dict, Optional
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from strands import tool
 
@@ -17,6 +18,43 @@ logger = logging.getLogger(__name__)
 # Global configuration cache
 _config_cache = {}
 
+# Shared client settings for every AWS client the system creates: a big
+# enough connection pool that concurrent tool calls reuse warm TLS
+# connections instead of handshaking, keepalive so idle polls (FIS status
+# checks) keep their connection, and adaptive retries for throttling.
+_BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'mode': 'adaptive', 'max_attempts': 5}
+)
+
+
+def get_boto_session() -> boto3.Session:
+    """
+    Get the shared boto3 session for the configured region.
+
+    Every agent and tool module creating its own session opens an
+    independent credential chain and connection pool; sharing one lets
+    clients built from it reuse cached credentials and keeps the number
+    of TLS handshakes across a workflow run down.
+
+    Returns:
+        boto3.Session: Shared session bound to the configured region
+    """
+    global _config_cache
+
+    if 'boto_session' in _config_cache:
+        return _config_cache['boto_session']
+
+    session = boto3.Session(region_name=get_aws_region())
+    _config_cache['boto_session'] = session
+    return session
+
+
+def get_client_config() -> Config:
+    """Get the shared botocore client Config (pooling, keepalive, retries)."""
+    return _BOTO_CLIENT_CONFIG
+
 
 
 def get_stack_region() -> str:
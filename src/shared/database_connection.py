@@ -4,6 +4,7 @@ Shared Database Connection Utilities for Chaos Agent System
 This module provides common database connection functionality that can be used across all agents
 to eliminate code duplication and ensure consistent database access patterns.
 """
+import asyncio
 import boto3
 import logging
 from typing import Dict, Any
@@ -17,6 +18,12 @@ _stack_outputs_cache = {}
 STACK_NAME = 'ChaosAgentDatabaseStack'
 DATABASE_NAME = 'chaosagent'
 
+# Shared RDS Data API client, created on first use. Reusing one client keeps
+# the underlying HTTP connection pool warm across calls instead of paying a
+# TCP/TLS handshake per statement; pool size, keepalive and retry behavior
+# come from the system-wide client config in shared.config.
+_rds_data_client = None
+
 
 
 
@@ -92,12 +99,24 @@ def get_database_config() -> Dict[str, str]:
 
 def get_rds_data_client():
     """
-    Get RDS Data API client.
-    
+    Get the shared RDS Data API client.
+
+    The client (and its HTTP connection pool) is created once and reused
+    across all calls from all tool modules.
+
     Returns:
         boto3 RDS Data API client
     """
-    return boto3.client('rds-data')
+    global _rds_data_client
+
+    if _rds_data_client is None:
+        # Imported lazily: config resolves the region through this module
+        from .config import get_boto_session, get_client_config
+        _rds_data_client = get_boto_session().client(
+            'rds-data', config=get_client_config()
+        )
+
+    return _rds_data_client
 
 def execute_sql(sql: str, parameters: list = None) -> Dict[str, Any]:
     """
@@ -142,33 +161,106 @@ def execute_sql(sql: str, parameters: list = None) -> Dict[str, Any]:
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
+def execute_batch_sql(sql: str, parameter_sets: list) -> Dict[str, Any]:
+    """
+    Execute a SQL statement once per parameter set using the RDS Data API.
+
+    batch_execute_statement parses the statement once and binds each row
+    server-side, so fixed-shape batch DML avoids the per-row placeholder
+    suffixes and large statement text of a handcrafted multi-row VALUES.
+
+    Args:
+        sql: SQL statement to execute (single-row placeholders, e.g. :title)
+        parameter_sets: List of parameter lists, one per row
+
+    Returns:
+        Dict containing the response from RDS Data API (updateResults)
+
+    Raises:
+        RuntimeError: If SQL execution fails
+    """
+    try:
+        client = get_rds_data_client()
+        db_config = get_database_config()
+
+        logger.debug(f"Executing batch SQL for {len(parameter_sets)} parameter sets: {sql[:100]}...")
+        response = client.batch_execute_statement(
+            resourceArn=db_config['cluster_arn'],
+            secretArn=db_config['secret_arn'],
+            database=db_config['database_name'],
+            sql=sql,
+            parameterSets=parameter_sets
+        )
+        logger.debug("Batch SQL execution successful")
+
+        return response
+
+    except ClientError as e:
+        error_msg = f"Database error executing batch SQL: {str(e)}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+    except Exception as e:
+        error_msg = f"Unexpected error executing batch SQL: {str(e)}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+async def execute_sql_async(sql: str, parameters: list = None) -> Dict[str, Any]:
+    """
+    Execute a SQL statement using the RDS Data API without blocking the event loop.
+
+    Callers that issue several independent statements can overlap the network
+    round-trips with asyncio.gather instead of paying them sequentially. The
+    synchronous execute_sql remains the entry point for tool functions, which
+    are invoked synchronously by the agents.
+
+    Args:
+        sql: SQL statement to execute
+        parameters: Optional list of parameters for the SQL statement
+
+    Returns:
+        Dict containing the response from RDS Data API
+
+    Raises:
+        RuntimeError: If SQL execution fails
+    """
+    return await asyncio.to_thread(execute_sql, sql, parameters)
+
+# Type-keyed dispatch for boxing parameter values into Data API field dicts.
+# Batch tools call format_parameter once per field per row, so a single dict
+# lookup here replaces the isinstance ladder on that hot path. Exact-type
+# keying also keeps bool (a subclass of int) on the boolean branch.
+_VALUE_BOXERS = {
+    bool: lambda v: {'booleanValue': v},
+    int: lambda v: {'longValue': v},
+    float: lambda v: {'doubleValue': v},
+    str: lambda v: {'stringValue': v},
+}
+
 def format_parameter(name: str, value: Any, is_json: bool = False) -> Dict[str, Any]:
     """
     Format a parameter for RDS Data API.
-    
+
     Args:
         name: Parameter name
         value: Parameter value
         is_json: Whether the parameter should be treated as JSON/JSONB
-        
+
     Returns:
         Dict formatted for RDS Data API parameters
     """
-    param = {'name': name}
-    
     if value is None:
-        param['value'] = {'isNull': True}
-    elif isinstance(value, bool):
-        param['value'] = {'booleanValue': value}
-    elif isinstance(value, int):
-        param['value'] = {'longValue': value}
-    elif isinstance(value, float):
-        param['value'] = {'doubleValue': value}
-    elif is_json:
-        # For JSONB columns, we need to cast the string value to JSONB in SQL
-        param['value'] = {'stringValue': str(value)}
-        param['typeHint'] = 'JSON'
-    else:
-        param['value'] = {'stringValue': str(value)}
-    
-    return param
+        return {'name': name, 'value': {'isNull': True}}
+
+    if not is_json:
+        boxer = _VALUE_BOXERS.get(value.__class__)
+        if boxer is not None:
+            return {'name': name, 'value': boxer(value)}
+        return {'name': name, 'value': {'stringValue': str(value)}}
+
+    # JSON parameters: numeric/boolean values still box natively
+    boxer = _VALUE_BOXERS.get(value.__class__)
+    if boxer is not None and value.__class__ is not str:
+        return {'name': name, 'value': boxer(value)}
+
+    # For JSONB columns, we need to cast the string value to JSONB in SQL
+    return {'name': name, 'value': {'stringValue': str(value)}, 'typeHint': 'JSON'}
@@ -90,15 +90,19 @@ def insert_experiment(
 def get_experiments(
     status_filter: Optional[str] = None,
     hypothesis_id: Optional[int] = None,
-    limit: int = 10
+    limit: int = 10,
+    experiment_id: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     Get experiments from the database.
     
     Args:
-        status_filter: Optional status to filter by (e.g., "draft", "planned", "validation_failed")
+        status_filter: Optional status to filter by (e.g., "draft", "planned", "validation_failed").
+                       Accepts a comma-separated list (e.g., "completed,failed,stopped") to
+                       fetch experiments in any of several statuses with one query.
         hypothesis_id: Optional hypothesis ID to filter by
         limit: Maximum number of experiments to return
+        experiment_id: Optional specific experiment ID to retrieve
         
     Returns:
         Dict containing list of experiments and query metadata
@@ -111,13 +115,26 @@ def get_experiments(
         parameters = []
         
         if status_filter:
-            where_conditions.append("e.status = :status")
-            parameters.append(format_parameter('status', status_filter))
+            if ',' in status_filter:
+                # Multi-status filter in one round-trip; the Data API has no
+                # native array binding, so the list travels as a delimited
+                # string split server-side
+                where_conditions.append("e.status = ANY(string_to_array(:status, ','))")
+                parameters.append(format_parameter('status', ','.join(
+                    st.strip() for st in status_filter.split(',') if st.strip()
+                )))
+            else:
+                where_conditions.append("e.status = :status")
+                parameters.append(format_parameter('status', status_filter))
         
         if hypothesis_id is not None:
             where_conditions.append("e.hypothesis_id = :hypothesis_id")
             parameters.append(format_parameter('hypothesis_id', hypothesis_id))
         
+        if experiment_id is not None:
+            where_conditions.append("e.id = :experiment_id")
+            parameters.append(format_parameter('experiment_id', experiment_id))
+        
         # Base query with joins to get hypothesis and component information
         base_sql = """
         SELECT e.id, e.hypothesis_id, e.title, e.description, e.experiment_plan,
@@ -182,7 +199,8 @@ def get_experiments(
             "count": len(experiments),
             "filters": {
                 "status": status_filter,
-                "hypothesis_id": hypothesis_id
+                "hypothesis_id": hypothesis_id,
+                "experiment_id": experiment_id
             },
             "message": f"Retrieved {len(experiments)} experiments"
         }
@@ -315,3 +333,84 @@ def update_experiment(
     except Exception as e:
         logger.error(f"Unexpected error updating experiment: {str(e)}")
         return False
+
+@tool
+def update_experiments_status_batch(
+    experiment_ids: List[int],
+    status: str,
+    experiment_notes: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Update the status of multiple experiments in a single database call.
+
+    Use this instead of calling update_experiment once per experiment when
+    the same status applies to a whole batch - one UPDATE replaces N
+    round-trips.
+
+    Args:
+        experiment_ids: IDs of the experiments to update
+        status: New status to set for all of them
+        experiment_notes: Optional notes to set on all of them
+
+    Returns:
+        Dict containing success status and the number of rows updated
+    """
+    logger.info(f"Batch updating {len(experiment_ids)} experiments to status '{status}'")
+
+    try:
+        if not experiment_ids:
+            return {
+                "success": False,
+                "error": "No experiment IDs provided",
+                "updated_count": 0,
+                "message": "No experiments to update"
+            }
+
+        set_clauses = ["status = :status", "updated_at = CURRENT_TIMESTAMP"]
+        parameters = [format_parameter('status', status)]
+
+        if experiment_notes is not None:
+            set_clauses.append("experiment_notes = :experiment_notes")
+            parameters.append(format_parameter('experiment_notes', experiment_notes))
+
+        # The Data API has no native array binding, so the ID list travels
+        # as a delimited string and is cast back to bigint[] server-side
+        parameters.append(format_parameter(
+            'experiment_ids', ','.join(str(int(experiment_id)) for experiment_id in experiment_ids)
+        ))
+
+        sql = f"""
+        UPDATE experiment SET
+            {', '.join(set_clauses)}
+        WHERE id = ANY(string_to_array(:experiment_ids, ',')::bigint[])
+        """
+
+        logger.debug("Executing batch UPDATE for experiments")
+        response = execute_sql(sql, parameters)
+
+        updated_count = response.get('numberOfRecordsUpdated', 0)
+        logger.info(f"Batch updated {updated_count} experiments to status '{status}'")
+
+        return {
+            "success": updated_count > 0,
+            "updated_count": updated_count,
+            "requested_count": len(experiment_ids),
+            "message": f"Updated {updated_count} of {len(experiment_ids)} experiments to '{status}'"
+        }
+
+    except RuntimeError as e:
+        logger.error(f"Database error in batch status update: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e),
+            "updated_count": 0,
+            "message": "Database error during batch status update"
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in batch status update: {str(e)}")
+        return {
+            "success": False,
+            "error": f"Unexpected error: {str(e)}",
+            "updated_count": 0,
+            "message": "Failed to batch update experiment status"
+        }
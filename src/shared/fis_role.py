@@ -4,10 +4,10 @@ FIS Role Configuration Tool
 Provides access to the pre-generated FIS execution role ARN from CloudFormation exports.
 """
 from strands import tool
-import boto3
 import logging
 from typing import Dict, Any
 from botocore.exceptions import ClientError
+from .config import get_boto_session, get_client_config
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +20,7 @@ def get_fis_execution_role() -> Dict[str, Any]:
         Dict containing the FIS execution role ARN and name
     """
     try:
-        cf_client = boto3.client('cloudformation')
+        cf_client = get_boto_session().client('cloudformation', config=get_client_config())
         
         # Get the exported role ARN from CloudFormation
         exports = cf_client.list_exports()
@@ -4,6 +4,7 @@ Hypothesis Database Tools
 Tools for managing hypotheses in the database.
 """
 from strands import tool
+import functools
 import logging
 from typing import Dict, Any, List, Optional
 from .database_connection import execute_sql, format_parameter
@@ -11,6 +12,193 @@ from .database_connection import execute_sql, format_parameter
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Column layout of the hypothesis SELECT below: (result key, Data API field, default).
+# Driving row parsing from this table keeps the per-row work to a tight loop
+# instead of 14 hand-written extractions per record.
+_HYP_COLUMNS = (
+    ('id', 'longValue', None),
+    ('title', 'stringValue', ''),
+    ('description', 'stringValue', ''),
+    ('persona', 'stringValue', ''),
+    ('steady_state_description', 'stringValue', ''),
+    ('failure_mode', 'stringValue', ''),
+    ('status', 'stringValue', ''),
+    ('priority', 'longValue', None),
+    ('notes', 'stringValue', ''),
+    ('system_component_id', 'longValue', None),
+    ('created_at', 'stringValue', ''),
+    ('updated_at', 'stringValue', ''),
+    ('component_name', 'stringValue', ''),
+    ('component_type', 'stringValue', ''),
+)
+
+# Columns update_hypothesis may modify, with their pre-built SET fragments.
+_UPDATABLE_FIELDS = (
+    'title', 'description', 'persona', 'steady_state_description',
+    'failure_mode', 'status', 'priority', 'notes', 'system_component_id',
+)
+_UPDATE_FRAGMENTS = {name: f"{name} = :{name}" for name in _UPDATABLE_FIELDS}
+
+@functools.lru_cache(maxsize=256)
+def _update_sql(fields: tuple) -> str:
+    """
+    Build (and cache) the UPDATE statement for a combination of fields.
+
+    Agent traffic tends to reuse a handful of combinations (status only,
+    priority only, status+notes, ...), so caching by the field tuple gives the
+    database a stable statement text per combination.
+    """
+    set_clause = ', '.join(_UPDATE_FRAGMENTS[name] for name in fields)
+    return f"""
+        UPDATE hypothesis SET
+            {set_clause}, updated_at = CURRENT_TIMESTAMP
+        WHERE id = :hypothesis_id
+        """
+
+def _validate_hypothesis_row(i: int, hypothesis: Any) -> None:
+    """Validate one batch-insert row, raising ValueError with its index."""
+    if not isinstance(hypothesis, dict):
+        raise ValueError(f"Hypothesis {i} is not a dictionary")
+    if 'title' not in hypothesis:
+        raise ValueError(f"Hypothesis {i} missing required key 'title'")
+    if not isinstance(hypothesis['title'], str) or not hypothesis['title'].strip():
+        raise ValueError(f"Hypothesis {i} has invalid title")
+
+# Columnar views over _HYP_COLUMNS: the result keys and the per-column
+# (field, default) extractor pairs, kept parallel so the parse loop zips the
+# record against them directly.
+_HYP_KEYS = tuple(key for key, _, _ in _HYP_COLUMNS)
+_HYP_EXTRACTORS = tuple((field, default) for _, field, default in _HYP_COLUMNS)
+
+def _parse_hypothesis_record(record) -> Dict[str, Any]:
+    """Convert one Data API record into a hypothesis dict using _HYP_COLUMNS.
+
+    Rows stay plain dicts deliberately: tool results are serialized to JSON
+    for the agent and downstream code keys into them by name, so a slotted
+    class or NamedTuple would just be converted straight back per row.
+    """
+    return dict(zip(_HYP_KEYS, (
+        cell.get(field, default) if cell else None
+        for (field, default), cell in zip(_HYP_EXTRACTORS, record)
+    )))
+
+# Base query with joins to get component information
+_HYPOTHESES_BASE_SQL = """
+        SELECT h.id, h.title, h.description, h.persona, h.steady_state_description,
+               h.failure_mode, h.status, h.priority, h.notes, h.system_component_id,
+               h.created_at, h.updated_at,
+               sc.name as component_name, sc.type as component_type
+        FROM hypothesis h
+        LEFT JOIN system_component sc ON h.system_component_id = sc.id
+        """
+
+# WHERE fragments keyed by filter-shape token; see _hypotheses_select_sql.
+# The service filter uses ILIKE with one bind parameter referenced three
+# times. For large hypothesis tables a trigram index makes these %x%
+# matches indexed:
+# CREATE INDEX hypothesis_title_trgm ON hypothesis USING gin (title gin_trgm_ops)
+_SELECT_CONDITIONS = {
+    'status': "h.status = :status",
+    'priority': "h.priority = :priority",
+    'component': "h.system_component_id = :system_component_id",
+    'service': "(sc.type ILIKE :service_filter OR h.title ILIKE :service_filter OR h.description ILIKE :service_filter)",
+    'priority_range': "h.priority BETWEEN :min_priority AND :max_priority",
+}
+
+@functools.lru_cache(maxsize=128)
+def _id_placeholders(n: int) -> str:
+    """Build (and cache) the ":id_0,:id_1,..." list for an n-way IN clause."""
+    return ','.join(f':id_{i}' for i in range(n))
+
+@functools.lru_cache(maxsize=128)
+def _hypotheses_select_sql(shape: tuple) -> str:
+    """
+    Build (and cache) the hypothesis SELECT statement for a filter shape.
+
+    The statement text only depends on which filters are active (and the
+    IN-list arity for id filters), so repeated calls with the same shape -
+    the common case for agents polling in a loop - skip string assembly
+    entirely.
+    """
+    where_conditions = []
+    order_clause = " ORDER BY h.priority ASC, h.created_at DESC LIMIT :limit"
+
+    for token in shape:
+        if token.startswith('ids:'):
+            where_conditions.append(f"h.id IN ({_id_placeholders(int(token[4:]))})")
+        elif token == 'top_n':
+            order_clause = " ORDER BY h.priority ASC, h.created_at DESC LIMIT :top_n"
+        else:
+            where_conditions.append(_SELECT_CONDITIONS[token])
+
+    sql = _HYPOTHESES_BASE_SQL
+    if where_conditions:
+        sql += " WHERE " + " AND ".join(where_conditions)
+    return sql + order_clause
+
+# Rows per multi-row INSERT statement. The Data API caps both request
+# payload size and parameter count per call, so very large batches are
+# split into fixed-size chunks instead of failing at the cliff.
+# batch_execute_statement would parse the statement once server-side, but
+# Aurora PostgreSQL does not populate generatedFields in its response and
+# the batch call returns no records, so RETURNING id would be lost; the
+# chunked multi-row INSERT through execute_statement keeps the generated
+# keys readable. COPY FROM STDIN would beat this for multi-thousand-row
+# loads, but the Data API does not support COPY.
+_MAX_BATCH_ROWS = 500
+
+# Field order for multi-row insert placeholders, shared by _row_placeholders
+# and the parameter builders below.
+_BATCH_INSERT_FIELDS = (
+    'title', 'description', 'persona', 'steady_state_description',
+    'failure_mode', 'status', 'priority', 'notes', 'system_component_id',
+)
+
+@functools.lru_cache(maxsize=1024)
+def _row_placeholders(i: int) -> str:
+    """Build (and cache) the placeholder tuple "(:title_i, ...)" for row i."""
+    return '(' + ', '.join(f':{field}_{i}' for field in _BATCH_INSERT_FIELDS) + ')'
+
+@functools.lru_cache(maxsize=64)
+def _batch_insert_sql(n: int) -> str:
+    """
+    Build (and cache) the multi-row INSERT statement for a batch of n hypotheses.
+
+    Batch sizes repeat heavily in practice, so caching the generated SQL avoids
+    rebuilding identical VALUES clauses on every call and gives the database a
+    stable statement text to recognize. Row placeholder tuples are cached per
+    index, so building the statement for a new batch size only formats the
+    rows it has not seen before.
+    """
+    values_clauses = ', '.join(_row_placeholders(i) for i in range(n))
+    return f"""
+        INSERT INTO hypothesis (
+            title, description, persona, steady_state_description,
+            failure_mode, status, priority, notes, system_component_id
+        )
+        VALUES {values_clauses}
+        RETURNING id
+        """
+
+@functools.lru_cache(maxsize=64)
+def _batch_priority_update_sql(n: int) -> str:
+    """
+    Build (and cache) the batch priority UPDATE statement for n hypotheses.
+
+    Uses an UPDATE ... FROM (VALUES ...) join rather than a CASE expression,
+    so each id/priority parameter appears once and the planner can join the
+    values table against the primary key instead of evaluating an N-arm CASE
+    per matched row.
+    """
+    values_clauses = ','.join(f"(:id_{i}, :priority_{i})" for i in range(n))
+    return f"""
+        UPDATE hypothesis h
+        SET priority = v.priority,
+            updated_at = CURRENT_TIMESTAMP
+        FROM (VALUES {values_clauses}) AS v(id, priority)
+        WHERE h.id = v.id
+        """
+
 @tool
 def insert_hypothesis(
     title: str,
@@ -40,7 +228,7 @@ def insert_hypothesis(
     Returns:
         The ID of the inserted hypothesis, or None if insertion failed
     """
-    logger.info(f"Inserting new hypothesis: '{title}' with status '{status}' and priority {priority}")
+    logger.info("Inserting new hypothesis: '%s' with status '%s' and priority %s", title, status, priority)
     
     try:
         # Insert new hypothesis
@@ -73,15 +261,15 @@ def insert_hypothesis(
         
         # Extract hypothesis ID from response
         hypothesis_id = response['records'][0][0]['longValue']
-        logger.info(f"Successfully inserted hypothesis with ID: {hypothesis_id}")
+        logger.info("Successfully inserted hypothesis with ID: %s", hypothesis_id)
         
         return hypothesis_id
         
     except RuntimeError as e:
-        logger.error(f"Database error inserting hypothesis: {str(e)}")
+        logger.error("Database error inserting hypothesis: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error inserting hypothesis: {str(e)}")
+        logger.error("Unexpected error inserting hypothesis: %s", e)
         return None
 
 @tool
@@ -115,64 +303,40 @@ def update_hypothesis(
     Returns:
         True if update was successful, False otherwise
     """
-    logger.info(f"Updating hypothesis ID: {hypothesis_id}")
+    logger.info("Updating hypothesis ID: %s", hypothesis_id)
     
     try:
-        # Build dynamic UPDATE query based on provided parameters
+        # Build dynamic UPDATE query by iterating the updatable-field table
+        field_values = (
+            ('title', title),
+            ('description', description),
+            ('persona', persona),
+            ('steady_state_description', steady_state_description),
+            ('failure_mode', failure_mode),
+            ('status', status),
+            ('priority', priority),
+            ('notes', notes),
+            ('system_component_id', system_component_id),
+        )
+
         update_fields = []
         parameters = []
-        
-        if title is not None:
-            update_fields.append("title = :title")
-            parameters.append(format_parameter('title', title))
-        
-        if description is not None:
-            update_fields.append("description = :description")
-            parameters.append(format_parameter('description', description))
-        
-        if persona is not None:
-            update_fields.append("persona = :persona")
-            parameters.append(format_parameter('persona', persona))
-        
-        if steady_state_description is not None:
-            update_fields.append("steady_state_description = :steady_state_description")
-            parameters.append(format_parameter('steady_state_description', steady_state_description))
-        
-        if failure_mode is not None:
-            update_fields.append("failure_mode = :failure_mode")
-            parameters.append(format_parameter('failure_mode', failure_mode))
-        
-        if status is not None:
-            update_fields.append("status = :status")
-            parameters.append(format_parameter('status', status))
-        
-        if priority is not None:
-            update_fields.append("priority = :priority")
-            parameters.append(format_parameter('priority', priority))
-        
-        if notes is not None:
-            update_fields.append("notes = :notes")
-            parameters.append(format_parameter('notes', notes))
-        
-        if system_component_id is not None:
-            update_fields.append("system_component_id = :system_component_id")
-            parameters.append(format_parameter('system_component_id', system_component_id))
-        
+
+        for name, value in field_values:
+            if value is not None:
+                update_fields.append(name)
+                parameters.append(format_parameter(name, value))
+
         if not update_fields:
             logger.warning("No fields provided for update")
             return False
-        
-        # Always update the updated_at timestamp
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-        
+
         # Add the hypothesis_id parameter for WHERE clause
         parameters.append(format_parameter('hypothesis_id', hypothesis_id))
-        
-        sql = f"""
-        UPDATE hypothesis SET
-            {', '.join(update_fields)}
-        WHERE id = :hypothesis_id
-        """
+
+        # The statement (including updated_at = CURRENT_TIMESTAMP) is cached
+        # per combination of updated fields
+        sql = _update_sql(tuple(update_fields))
         
         logger.debug("Executing UPDATE for hypothesis")
         response = execute_sql(sql, parameters)
@@ -181,17 +345,17 @@ def update_hypothesis(
         records_updated = response.get('numberOfRecordsUpdated', 0)
         
         if records_updated > 0:
-            logger.info(f"Successfully updated hypothesis with ID: {hypothesis_id}")
+            logger.info("Successfully updated hypothesis with ID: %s", hypothesis_id)
             return True
         else:
-            logger.warning(f"No hypothesis found with ID: {hypothesis_id}")
+            logger.warning("No hypothesis found with ID: %s", hypothesis_id)
             return False
         
     except RuntimeError as e:
-        logger.error(f"Database error updating hypothesis: {str(e)}")
+        logger.error("Database error updating hypothesis: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error updating hypothesis: {str(e)}")
+        logger.error("Unexpected error updating hypothesis: %s", e)
         return False
 
 @tool
@@ -221,96 +385,62 @@ def get_hypotheses(
     Returns:
         Dict containing list of hypotheses and query metadata
     """
-    logger.info(f"Getting hypotheses with filters - IDs: {hypothesis_ids}, status: {status_filter}, priority: {priority_filter}, component: {system_component_id}, service: {service_filter}, top_n: {top_n}, priority_range: {priority_range}")
+    logger.info("Getting hypotheses with filters - IDs: %s, status: %s, priority: %s, component: %s, service: %s, top_n: %s, priority_range: %s",
+                hypothesis_ids, status_filter, priority_filter, system_component_id, service_filter, top_n, priority_range)
     
     try:
-        # Build SQL query with optional filters
-        where_conditions = []
+        # Collect the active filter shape and parameters; the SQL text is
+        # cached per shape
+        shape = []
         parameters = []
-        
+
         # Handle specific hypothesis IDs
         if hypothesis_ids:
-            placeholders = ','.join([f':id_{i}' for i in range(len(hypothesis_ids))])
-            where_conditions.append(f"h.id IN ({placeholders})")
+            shape.append(f'ids:{len(hypothesis_ids)}')
             for i, hyp_id in enumerate(hypothesis_ids):
                 parameters.append(format_parameter(f'id_{i}', hyp_id))
-        
+
         if status_filter:
-            where_conditions.append("h.status = :status")
+            shape.append('status')
             parameters.append(format_parameter('status', status_filter))
-        
+
         if priority_filter is not None:
-            where_conditions.append("h.priority = :priority")
+            shape.append('priority')
             parameters.append(format_parameter('priority', priority_filter))
-        
+
         if system_component_id is not None:
-            where_conditions.append("h.system_component_id = :system_component_id")
+            shape.append('component')
             parameters.append(format_parameter('system_component_id', system_component_id))
-        
+
         # Handle service filter (search in component type or hypothesis title/description)
         if service_filter:
-            where_conditions.append("(UPPER(sc.type) LIKE UPPER(:service_filter) OR UPPER(h.title) LIKE UPPER(:service_filter_title) OR UPPER(h.description) LIKE UPPER(:service_filter_desc))")
+            shape.append('service')
             parameters.append(format_parameter('service_filter', f'%{service_filter}%'))
-            parameters.append(format_parameter('service_filter_title', f'%{service_filter}%'))
-            parameters.append(format_parameter('service_filter_desc', f'%{service_filter}%'))
-        
+
         # Handle priority range
         if priority_range and len(priority_range) == 2:
             min_priority, max_priority = priority_range
-            where_conditions.append("h.priority BETWEEN :min_priority AND :max_priority")
+            shape.append('priority_range')
             parameters.append(format_parameter('min_priority', min_priority))
             parameters.append(format_parameter('max_priority', max_priority))
-        
-        # Base query with joins to get component information
-        base_sql = """
-        SELECT h.id, h.title, h.description, h.persona, h.steady_state_description,
-               h.failure_mode, h.status, h.priority, h.notes, h.system_component_id,
-               h.created_at, h.updated_at,
-               sc.name as component_name, sc.type as component_type
-        FROM hypothesis h
-        LEFT JOIN system_component sc ON h.system_component_id = sc.id
-        """
-        
-        if where_conditions:
-            sql = base_sql + " WHERE " + " AND ".join(where_conditions)
-        else:
-            sql = base_sql
-        
+
         # Handle top_n parameter (overrides limit)
         if top_n is not None:
-            sql += " ORDER BY h.priority ASC, h.created_at DESC LIMIT :top_n"
+            shape.append('top_n')
             parameters.append(format_parameter('top_n', top_n))
         else:
-            sql += " ORDER BY h.priority ASC, h.created_at DESC LIMIT :limit"
             parameters.append(format_parameter('limit', limit))
-        
+
+        sql = _hypotheses_select_sql(tuple(shape))
+
         logger.debug("Executing SQL SELECT for hypotheses")
         response = execute_sql(sql, parameters)
         
         # Parse the response
-        hypotheses = []
         records = response.get('records', [])
-        
-        for record in records:
-            hypothesis = {
-                'id': record[0].get('longValue'),
-                'title': record[1].get('stringValue', ''),
-                'description': record[2].get('stringValue', '') if record[2] else None,
-                'persona': record[3].get('stringValue', '') if record[3] else None,
-                'steady_state_description': record[4].get('stringValue', '') if record[4] else None,
-                'failure_mode': record[5].get('stringValue', '') if record[5] else None,
-                'status': record[6].get('stringValue', ''),
-                'priority': record[7].get('longValue'),
-                'notes': record[8].get('stringValue', '') if record[8] else None,
-                'system_component_id': record[9].get('longValue') if record[9] else None,
-                'created_at': record[10].get('stringValue', ''),
-                'updated_at': record[11].get('stringValue', ''),
-                'component_name': record[12].get('stringValue', '') if record[12] else None,
-                'component_type': record[13].get('stringValue', '') if record[13] else None
-            }
-            hypotheses.append(hypothesis)
-        
-        logger.info(f"Retrieved {len(hypotheses)} hypotheses from database")
+        hypotheses = [_parse_hypothesis_record(record) for record in records]
+
+        logger.info("Retrieved %d hypotheses from database", len(hypotheses))
         
         return {
             "success": True,
@@ -325,7 +455,7 @@ def get_hypotheses(
         }
         
     except RuntimeError as e:
-        logger.error(f"Database error getting hypotheses: {str(e)}")
+        logger.error("Database error getting hypotheses: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -334,7 +464,7 @@ def get_hypotheses(
             "message": "Failed to get hypotheses from database"
         }
     except Exception as e:
-        logger.error(f"Unexpected error getting hypotheses: {str(e)}")
+        logger.error("Unexpected error getting hypotheses: %s", e)
         return {
             "success": False,
             "error": f"Unexpected error: {str(e)}",
@@ -362,7 +492,7 @@ def batch_update_hypothesis_priorities(
     Returns:
         Dict containing success status, update count, and any error information
     """
-    logger.info(f"Batch updating priorities for {len(priority_updates)} hypotheses")
+    logger.info("Batch updating priorities for %d hypotheses", len(priority_updates))
     
     try:
         if not priority_updates:
@@ -374,50 +504,50 @@ def batch_update_hypothesis_priorities(
                 "message": "No hypotheses to update"
             }
         
-        # Validate input format
+        # Validate and dedupe in one pass; for a repeated hypothesis_id the
+        # last entry wins, matching what applying the updates in order would
+        # produce, and the statement only carries the unique rows
+        unique_priorities = {}
+
         for i, update in enumerate(priority_updates):
             if not isinstance(update, dict):
                 raise ValueError(f"Update {i} is not a dictionary")
             if 'hypothesis_id' not in update or 'priority' not in update:
                 raise ValueError(f"Update {i} missing required keys 'hypothesis_id' or 'priority'")
-            if not isinstance(update['hypothesis_id'], int) or not isinstance(update['priority'], int):
-                raise ValueError(f"Update {i} has non-integer values")
-        
-        # Build CASE statement for batch update
-        case_statements = []
-        hypothesis_ids = []
-        parameters = []
-        
-        for i, update in enumerate(priority_updates):
+
             hypothesis_id = update['hypothesis_id']
             priority = update['priority']
-            
-            case_statements.append(f"WHEN :id_{i} THEN :priority_{i}")
-            hypothesis_ids.append(str(hypothesis_id))
-            
-            parameters.append(format_parameter(f'id_{i}', hypothesis_id))
-            parameters.append(format_parameter(f'priority_{i}', priority))
-        
-        # Create the batch update SQL
-        ids_placeholder = ','.join([f':id_{i}' for i in range(len(priority_updates))])
-        
-        sql = f"""
-        UPDATE hypothesis 
-        SET priority = CASE id
-            {' '.join(case_statements)}
-            END,
-            updated_at = CURRENT_TIMESTAMP
-        WHERE id IN ({ids_placeholder})
-        """
-        
-        logger.debug(f"Executing batch UPDATE for {len(priority_updates)} hypotheses")
+
+            if not isinstance(hypothesis_id, int) or not isinstance(priority, int):
+                raise ValueError(f"Update {i} has non-integer values")
+
+            unique_priorities[hypothesis_id] = priority
+
+        duplicate_count = len(priority_updates) - len(unique_priorities)
+        if duplicate_count:
+            logger.warning("Collapsed %d duplicate hypothesis IDs in priority update batch", duplicate_count)
+
+        # Build parameters over the deduped rows; the SQL template is cached
+        # per batch size and the parameter list is pre-sized so large batches
+        # avoid incremental list growth. The local alias keeps the 2N
+        # format_parameter calls on LOAD_FAST instead of a global lookup.
+        _fp = format_parameter
+        parameters = [None] * (2 * len(unique_priorities))
+
+        for i, (hypothesis_id, priority) in enumerate(unique_priorities.items()):
+            parameters[2 * i] = _fp(f'id_{i}', hypothesis_id)
+            parameters[2 * i + 1] = _fp(f'priority_{i}', priority)
+
+        sql = _batch_priority_update_sql(len(unique_priorities))
+
+        logger.debug("Executing batch UPDATE for %d hypotheses", len(unique_priorities))
         response = execute_sql(sql, parameters)
         
         # Check how many rows were updated
         records_updated = response.get('numberOfRecordsUpdated', 0)
         
         if records_updated > 0:
-            logger.info(f"Successfully batch updated {records_updated} hypothesis priorities")
+            logger.info("Successfully batch updated %d hypothesis priorities", records_updated)
             return {
                 "success": True,
                 "updated_count": records_updated,
@@ -435,7 +565,7 @@ def batch_update_hypothesis_priorities(
             }
         
     except ValueError as e:
-        logger.error(f"Validation error in batch update: {str(e)}")
+        logger.error("Validation error in batch update: %s", e)
         return {
             "success": False,
             "error": f"Validation error: {str(e)}",
@@ -443,7 +573,7 @@ def batch_update_hypothesis_priorities(
             "message": "Failed to validate batch update data"
         }
     except RuntimeError as e:
-        logger.error(f"Database error in batch update: {str(e)}")
+        logger.error("Database error in batch update: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -451,7 +581,7 @@ def batch_update_hypothesis_priorities(
             "message": "Database error during batch update"
         }
     except Exception as e:
-        logger.error(f"Unexpected error in batch update: {str(e)}")
+        logger.error("Unexpected error in batch update: %s", e)
         return {
             "success": False,
             "error": f"Unexpected error: {str(e)}",
@@ -482,7 +612,7 @@ def batch_insert_hypotheses(
     Returns:
         Dict containing success status, inserted count, and hypothesis IDs
     """
-    logger.info(f"Batch inserting {len(hypotheses)} hypotheses")
+    logger.info("Batch inserting %d hypotheses", len(hypotheses))
     
     try:
         if not hypotheses:
@@ -495,74 +625,67 @@ def batch_insert_hypotheses(
                 "message": "No hypotheses to insert"
             }
         
-        # Validate input format
-        for i, hypothesis in enumerate(hypotheses):
-            if not isinstance(hypothesis, dict):
-                raise ValueError(f"Hypothesis {i} is not a dictionary")
-            if 'title' not in hypothesis:
-                raise ValueError(f"Hypothesis {i} missing required key 'title'")
-            if not isinstance(hypothesis['title'], str) or not hypothesis['title'].strip():
-                raise ValueError(f"Hypothesis {i} has invalid title")
-        
-        # Build batch INSERT with VALUES clause
-        values_clauses = []
-        parameters = []
-        
-        for i, hypothesis in enumerate(hypotheses):
-            # Set defaults for optional fields
-            title = hypothesis['title']
-            description = hypothesis.get('description')
-            persona = hypothesis.get('persona')
-            steady_state_description = hypothesis.get('steady_state_description')
-            failure_mode = hypothesis.get('failure_mode')
-            status = hypothesis.get('status', 'proposed')
-            priority = hypothesis.get('priority', 1)
-            notes = hypothesis.get('notes')
-            system_component_id = hypothesis.get('system_component_id')
-            
-            # Create parameter placeholders for this hypothesis
-            values_clauses.append(f"(:title_{i}, :description_{i}, :persona_{i}, :steady_state_description_{i}, :failure_mode_{i}, :status_{i}, :priority_{i}, :notes_{i}, :system_component_id_{i})")
-            
-            # Add parameters for this hypothesis
-            parameters.extend([
-                format_parameter(f'title_{i}', title),
-                format_parameter(f'description_{i}', description),
-                format_parameter(f'persona_{i}', persona),
-                format_parameter(f'steady_state_description_{i}', steady_state_description),
-                format_parameter(f'failure_mode_{i}', failure_mode),
-                format_parameter(f'status_{i}', status),
-                format_parameter(f'priority_{i}', priority),
-                format_parameter(f'notes_{i}', notes),
-                format_parameter(f'system_component_id_{i}', system_component_id)
-            ])
-        
-        # Create the batch insert SQL
-        sql = f"""
-        INSERT INTO hypothesis (
-            title, description, persona, steady_state_description, 
-            failure_mode, status, priority, notes, system_component_id
-        )
-        VALUES {', '.join(values_clauses)}
-        RETURNING id
-        """
-        
-        logger.debug(f"Executing batch INSERT for {len(hypotheses)} hypotheses")
-        response = execute_sql(sql, parameters)
-        
-        # Extract hypothesis IDs from response
+        logger.debug("Executing batch INSERT for %d hypotheses", len(hypotheses))
         hypothesis_ids = []
-        records = response.get('records', [])
-        
-        for record in records:
-            if record and len(record) > 0:
-                hypothesis_id = record[0].get('longValue')
-                if hypothesis_id:
-                    hypothesis_ids.append(hypothesis_id)
+        # Local alias: the loops below call this 9 times per row
+        _fp = format_parameter
+
+        # Validate every row before the first write: chunks commit as they
+        # execute, so a bad row in a later chunk must be caught while the
+        # database is still untouched, not after earlier chunks have landed.
+        for i, hypothesis in enumerate(hypotheses):
+            _validate_hypothesis_row(i, hypothesis)
+
+        # Chunked multi-row INSERT with a cached SQL template; RETURNING id
+        # comes back as ordinary records, which works on Aurora PostgreSQL
+        # where batch_execute_statement would drop the generated keys.
+        for start in range(0, len(hypotheses), _MAX_BATCH_ROWS):
+            chunk = hypotheses[start:start + _MAX_BATCH_ROWS]
+            parameters = []
+
+            for i, hypothesis in enumerate(chunk):
+                parameters.extend([
+                    _fp(f'title_{i}', hypothesis['title']),
+                    _fp(f'description_{i}', hypothesis.get('description')),
+                    _fp(f'persona_{i}', hypothesis.get('persona')),
+                    _fp(f'steady_state_description_{i}', hypothesis.get('steady_state_description')),
+                    _fp(f'failure_mode_{i}', hypothesis.get('failure_mode')),
+                    _fp(f'status_{i}', hypothesis.get('status', 'proposed')),
+                    _fp(f'priority_{i}', hypothesis.get('priority', 1)),
+                    _fp(f'notes_{i}', hypothesis.get('notes')),
+                    _fp(f'system_component_id_{i}', hypothesis.get('system_component_id'))
+                ])
+
+            try:
+                response = execute_sql(_batch_insert_sql(len(chunk)), parameters)
+            except Exception as e:
+                # Chunks commit as they execute, so rows from earlier chunks
+                # are already in the database. Report them so a retrying
+                # caller re-submits only what is missing; a first-chunk
+                # failure falls through to the normal error handling.
+                if not hypothesis_ids:
+                    raise
+                logger.error("Database error after %d hypotheses were inserted: %s", len(hypothesis_ids), e)
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "inserted_count": len(hypothesis_ids),
+                    "requested_count": len(hypotheses),
+                    "hypothesis_ids": hypothesis_ids,
+                    "message": f"Database error after inserting {len(hypothesis_ids)} of {len(hypotheses)} hypotheses; the returned IDs are already in the database"
+                }
+
+            # Extract hypothesis IDs from response
+            for record in response.get('records', []):
+                if record and len(record) > 0:
+                    hypothesis_id = record[0].get('longValue')
+                    if hypothesis_id:
+                        hypothesis_ids.append(hypothesis_id)
         
         inserted_count = len(hypothesis_ids)
         
         if inserted_count > 0:
-            logger.info(f"Successfully batch inserted {inserted_count} hypotheses")
+            logger.info("Successfully batch inserted %d hypotheses", inserted_count)
             return {
                 "success": True,
                 "inserted_count": inserted_count,
@@ -582,7 +705,7 @@ def batch_insert_hypotheses(
             }
         
     except ValueError as e:
-        logger.error(f"Validation error in batch insert: {str(e)}")
+        logger.error("Validation error in batch insert: %s", e)
         return {
             "success": False,
             "error": f"Validation error: {str(e)}",
@@ -591,7 +714,7 @@ def batch_insert_hypotheses(
             "message": "Failed to validate batch insert data"
         }
     except RuntimeError as e:
-        logger.error(f"Database error in batch insert: {str(e)}")
+        logger.error("Database error in batch insert: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -600,7 +723,7 @@ def batch_insert_hypotheses(
             "message": "Database error during batch insert"
         }
     except Exception as e:
-        logger.error(f"Unexpected error in batch insert: {str(e)}")
+        logger.error("Unexpected error in batch insert: %s", e)
         return {
             "success": False,
             "error": f"Unexpected error: {str(e)}",
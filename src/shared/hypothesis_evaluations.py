@@ -4,13 +4,164 @@ Hypothesis Evaluation Database Tools
 Tools for managing hypothesis evaluations in the database.
 """
 from strands import tool
+import functools
 import logging
+import numpy as np
 from typing import Dict, Any, List, Optional
-from .database_connection import execute_sql, format_parameter
+from .database_connection import execute_sql, execute_batch_sql, format_parameter
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Evaluation columns by Data API value kind. The batch path builds parameter
+# dicts directly from these tuples, since the value type per column is fixed
+# and re-dispatching on Python type for every one of the 7N parameters is
+# avoidable overhead.
+_EVAL_INT_COLS = (
+    'hypothesis_id', 'testability_score', 'specificity_score',
+    'realism_score', 'safety_score', 'learning_value_score',
+)
+_EVAL_FLOAT_COL = 'overall_score'
+
+# Rows per upsert statement. Bounds both the statement text and the bind
+# parameter count (7 per row) well under the Data API / Postgres limits, so
+# arbitrarily large batches degrade to more round-trips instead of failing.
+_MAX_UPSERT_ROWS = 500
+
+# Below this many rows a single multi-row statement round-trip wins; at or
+# above it, batch_execute_statement parses the single-row upsert once and
+# binds each parameter set server-side.
+_BATCH_EXECUTE_MIN_ROWS = 5
+
+# Single-row upsert used with batch_execute_statement
+_UPSERT_EVALUATION_ROW_SQL = """
+        INSERT INTO hypothesis_evaluation (
+            hypothesis_id, testability_score, specificity_score, realism_score,
+            safety_score, learning_value_score, overall_score
+        )
+        VALUES (
+            :hypothesis_id, :testability_score, :specificity_score, :realism_score,
+            :safety_score, :learning_value_score, :overall_score
+        )
+        ON CONFLICT (hypothesis_id) DO UPDATE SET
+            testability_score = EXCLUDED.testability_score,
+            specificity_score = EXCLUDED.specificity_score,
+            realism_score = EXCLUDED.realism_score,
+            safety_score = EXCLUDED.safety_score,
+            learning_value_score = EXCLUDED.learning_value_score,
+            overall_score = EXCLUDED.overall_score,
+            evaluation_timestamp = CURRENT_TIMESTAMP
+        """
+
+# Score columns bounds-checked 1-5 (everything integer except hypothesis_id)
+_EVAL_SCORE_KEYS = _EVAL_INT_COLS[1:]
+
+# All keys a batch evaluation row must carry; frozenset so the missing-key
+# check is one set difference per row instead of k membership probes
+_REQUIRED_EVAL_KEYS = frozenset(_EVAL_INT_COLS) | {_EVAL_FLOAT_COL}
+
+@functools.lru_cache(maxsize=1024)
+def _eval_row_placeholders(i: int) -> str:
+    """Placeholder tuple for row i of a multi-row VALUES upsert, cached so
+    repeated small batches reuse the formatted strings instead of rebuilding
+    seven suffixed placeholders per row per call."""
+    return (f"(:hypothesis_id_{i}, :testability_score_{i}, :specificity_score_{i}, "
+            f":realism_score_{i}, :safety_score_{i}, :learning_value_score_{i}, :overall_score_{i})")
+
+# Cell extractors for result-set parsing, one per Data API value kind
+def _long_cell(cell):
+    return cell.get('longValue')
+
+def _string_cell(cell):
+    return cell.get('stringValue', '')
+
+def _double_cell(cell):
+    return float(cell.get('doubleValue', 0))
+
+# Column tables for the evaluation SELECT: keys and cell extractors in the
+# same order as the SELECT list, consumed positionally by zip
+_EVALUATION_KEYS = (
+    'id', 'hypothesis_id', 'hypothesis_title', 'testability_score',
+    'specificity_score', 'realism_score', 'safety_score',
+    'learning_value_score', 'overall_score', 'evaluation_timestamp',
+)
+_EVALUATION_EXTRACTORS = (
+    _long_cell, _long_cell, _string_cell, _long_cell, _long_cell,
+    _long_cell, _long_cell, _long_cell, _double_cell, _string_cell,
+)
+
+def _parse_evaluation_record(record: list) -> Dict[str, Any]:
+    """
+    Build an evaluation dict from a Data API record.
+
+    One dict construction and one extractor call per cell instead of ten
+    literal key/.get pairs. Rows stay plain dicts (not namedtuples) because
+    tool results are JSON-serialized for the agents, and namedtuples would
+    serialize as bare arrays.
+    """
+    return dict(zip(
+        _EVALUATION_KEYS,
+        (extract(cell) for extract, cell in zip(_EVALUATION_EXTRACTORS, record))
+    ))
+
+def _validate_evaluations(evaluations: List[Dict[str, Any]]) -> None:
+    """
+    Per-row validation of batch evaluation input with precise error messages.
+
+    This is the slow path: the batch tool first runs a vectorized check and
+    only comes here to find the offending row/key when that check fails (or
+    when the input shape prevents vectorizing at all).
+    """
+    for i, evaluation in enumerate(evaluations):
+        if not isinstance(evaluation, dict):
+            raise ValueError(f"Evaluation {i} is not a dictionary")
+
+        missing = _REQUIRED_EVAL_KEYS - evaluation.keys()
+        if missing:
+            raise ValueError(f"Evaluation {i} missing required keys: {', '.join(sorted(missing))}")
+
+        # Validate score ranges (all score keys except hypothesis_id and overall_score)
+        for score_key in _EVAL_SCORE_KEYS:
+            score = evaluation[score_key]
+            if not isinstance(score, int) or score < 1 or score > 5:
+                raise ValueError(f"Evaluation {i}: {score_key} must be an integer between 1 and 5")
+
+        overall_score = evaluation['overall_score']
+        if not isinstance(overall_score, (int, float)) or overall_score < 1 or overall_score > 5:
+            raise ValueError(f"Evaluation {i}: overall_score must be a number between 1 and 5")
+
+def _evaluations_valid(evaluations: List[Dict[str, Any]]) -> bool:
+    """
+    Vectorized validity check over the whole batch.
+
+    Bounds checks run as numpy array comparisons instead of ~6 interpreted
+    branches per row. The type pre-checks are strict (exact int) so that
+    np.fromiter cannot silently truncate a float score into a passing value.
+    Returns False on any structural problem; callers then rerun the per-row
+    loop for the precise error.
+    """
+    try:
+        if not all(type(e[k]) is int for e in evaluations for k in _EVAL_SCORE_KEYS):
+            return False
+        if not all(isinstance(e[_EVAL_FLOAT_COL], (int, float)) for e in evaluations):
+            return False
+        if not all('hypothesis_id' in e for e in evaluations):
+            return False
+
+        n = len(evaluations)
+        scores = np.fromiter(
+            (e[k] for e in evaluations for k in _EVAL_SCORE_KEYS),
+            dtype=np.int64, count=n * len(_EVAL_SCORE_KEYS)
+        )
+        overall = np.fromiter(
+            (e[_EVAL_FLOAT_COL] for e in evaluations),
+            dtype=np.float64, count=n
+        )
+        return bool(((scores >= 1) & (scores <= 5)).all()) and \
+            bool(((overall >= 1) & (overall <= 5)).all())
+    except (KeyError, TypeError, ValueError):
+        return False
+
 @tool
 def insert_hypothesis_evaluation(
     hypothesis_id: int,
@@ -36,7 +187,7 @@ def insert_hypothesis_evaluation(
     Returns:
         Dict containing success status and evaluation ID
     """
-    logger.info(f"Inserting evaluation for hypothesis ID: {hypothesis_id}")
+    logger.info("Inserting evaluation for hypothesis ID: %s", hypothesis_id)
     
     try:
         # Validate scores
@@ -53,7 +204,11 @@ def insert_hypothesis_evaluation(
         if not isinstance(overall_score, (int, float)) or overall_score < 1 or overall_score > 5:
             raise ValueError("overall_score must be a number between 1 and 5")
         
-        # Insert or update evaluation
+        # Insert or update evaluation. ON CONFLICT is kept over an
+        # UPDATE-then-INSERT split: over the Data API each statement is an
+        # HTTP round-trip, and the split would need two statements plus
+        # Begin/CommitTransaction calls to stay atomic — four round-trips
+        # against one, dwarfing any server-side tuple-allocation savings.
         sql = """
         INSERT INTO hypothesis_evaluation (
             hypothesis_id, testability_score, specificity_score, realism_score,
@@ -89,7 +244,7 @@ def insert_hypothesis_evaluation(
         
         # Extract evaluation ID from response
         evaluation_id = response['records'][0][0]['longValue']
-        logger.info(f"Successfully inserted/updated evaluation with ID: {evaluation_id}")
+        logger.info("Successfully inserted/updated evaluation with ID: %s", evaluation_id)
         
         return {
             "success": True,
@@ -98,14 +253,14 @@ def insert_hypothesis_evaluation(
         }
         
     except ValueError as e:
-        logger.error(f"Validation error: {str(e)}")
+        logger.error("Validation error: %s", e)
         return {
             "success": False,
             "error": f"Validation error: {str(e)}",
             "message": "Failed to insert evaluation due to validation error"
         }
     except Exception as e:
-        logger.error(f"Error inserting hypothesis evaluation: {str(e)}")
+        logger.error("Error inserting hypothesis evaluation: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -132,7 +287,7 @@ def batch_insert_hypothesis_evaluations(
     Returns:
         Dict containing success status and inserted count
     """
-    logger.info(f"Batch inserting {len(evaluations)} hypothesis evaluations")
+    logger.info("Batch inserting %d hypothesis evaluations", len(evaluations))
     
     try:
         if not evaluations:
@@ -144,71 +299,77 @@ def batch_insert_hypothesis_evaluations(
                 "message": "No evaluations to insert"
             }
         
-        # Validate input format
-        for i, evaluation in enumerate(evaluations):
-            if not isinstance(evaluation, dict):
-                raise ValueError(f"Evaluation {i} is not a dictionary")
-            
-            required_keys = ['hypothesis_id', 'testability_score', 'specificity_score', 
-                            'realism_score', 'safety_score', 'learning_value_score', 'overall_score']
-            
-            for key in required_keys:
-                if key not in evaluation:
-                    raise ValueError(f"Evaluation {i} missing required key '{key}'")
-            
-            # Validate score ranges
-            for score_key in required_keys[1:-1]:  # All score keys except hypothesis_id and overall_score
-                score = evaluation[score_key]
-                if not isinstance(score, int) or score < 1 or score > 5:
-                    raise ValueError(f"Evaluation {i}: {score_key} must be an integer between 1 and 5")
-            
-            overall_score = evaluation['overall_score']
-            if not isinstance(overall_score, (int, float)) or overall_score < 1 or overall_score > 5:
-                raise ValueError(f"Evaluation {i}: overall_score must be a number between 1 and 5")
-        
-        # Build batch UPSERT with VALUES clause
-        values_clauses = []
-        parameters = []
-        
-        for i, evaluation in enumerate(evaluations):
-            # Create parameter placeholders for this evaluation
-            values_clauses.append(f"(:hypothesis_id_{i}, :testability_score_{i}, :specificity_score_{i}, :realism_score_{i}, :safety_score_{i}, :learning_value_score_{i}, :overall_score_{i})")
-            
-            # Add parameters for this evaluation
-            parameters.extend([
-                format_parameter(f'hypothesis_id_{i}', evaluation['hypothesis_id']),
-                format_parameter(f'testability_score_{i}', evaluation['testability_score']),
-                format_parameter(f'specificity_score_{i}', evaluation['specificity_score']),
-                format_parameter(f'realism_score_{i}', evaluation['realism_score']),
-                format_parameter(f'safety_score_{i}', evaluation['safety_score']),
-                format_parameter(f'learning_value_score_{i}', evaluation['learning_value_score']),
-                format_parameter(f'overall_score_{i}', evaluation['overall_score'])
-            ])
-        
-        # Create the batch upsert SQL
-        sql = f"""
-        INSERT INTO hypothesis_evaluation (
-            hypothesis_id, testability_score, specificity_score, realism_score,
-            safety_score, learning_value_score, overall_score
-        )
-        VALUES {', '.join(values_clauses)}
-        ON CONFLICT (hypothesis_id) DO UPDATE SET
-            testability_score = EXCLUDED.testability_score,
-            specificity_score = EXCLUDED.specificity_score,
-            realism_score = EXCLUDED.realism_score,
-            safety_score = EXCLUDED.safety_score,
-            learning_value_score = EXCLUDED.learning_value_score,
-            overall_score = EXCLUDED.overall_score,
-            evaluation_timestamp = CURRENT_TIMESTAMP
-        """
-        
-        logger.debug(f"Executing batch UPSERT for {len(evaluations)} evaluations")
-        response = execute_sql(sql, parameters)
-        
-        # Check how many rows were affected
-        records_affected = response.get('numberOfRecordsUpdated', 0)
+        # Validate input: vectorized check first, per-row loop only to locate
+        # the offending entry when something is wrong
+        if not _evaluations_valid(evaluations):
+            _validate_evaluations(evaluations)
+
+
+        records_affected = 0
+
+        if len(evaluations) >= _BATCH_EXECUTE_MIN_ROWS:
+            # Batch path: the single-row upsert is parsed once server-side and
+            # each row travels as a parameter set with stable names, so the
+            # payload no longer grows statement text with N. Chunking keeps
+            # each request under the Data API payload/parameter-set caps.
+            for start in range(0, len(evaluations), _MAX_UPSERT_ROWS):
+                chunk = evaluations[start:start + _MAX_UPSERT_ROWS]
+                parameter_sets = [
+                    [{'name': col, 'value': {'longValue': evaluation[col]}} for col in _EVAL_INT_COLS]
+                    + [{'name': _EVAL_FLOAT_COL, 'value': {'doubleValue': float(evaluation[_EVAL_FLOAT_COL])}}]
+                    for evaluation in chunk
+                ]
+
+                logger.debug("Executing batch UPSERT for %d evaluations", len(chunk))
+                response = execute_batch_sql(_UPSERT_EVALUATION_ROW_SQL, parameter_sets)
+
+                # One statement execution per parameter set; count only what
+                # the API actually reports rather than assuming the chunk
+                # landed in full
+                records_affected += len(response.get('updateResults', []))
+
+        else:
+            # Small batches: one multi-row VALUES upsert per (single) chunk;
+            # parameter dicts are built directly since the value kind per
+            # column is fixed
+            for start in range(0, len(evaluations), _MAX_UPSERT_ROWS):
+                chunk = evaluations[start:start + _MAX_UPSERT_ROWS]
+                values_clauses = []
+                parameters = []
+
+                for i, evaluation in enumerate(chunk):
+                    # Create parameter placeholders for this evaluation
+                    values_clauses.append(_eval_row_placeholders(i))
+
+                    # Add parameters for this evaluation
+                    for col in _EVAL_INT_COLS:
+                        parameters.append({'name': f'{col}_{i}', 'value': {'longValue': evaluation[col]}})
+                    parameters.append({'name': f'{_EVAL_FLOAT_COL}_{i}', 'value': {'doubleValue': float(evaluation[_EVAL_FLOAT_COL])}})
+
+                # Create the batch upsert SQL
+                sql = f"""
+                INSERT INTO hypothesis_evaluation (
+                    hypothesis_id, testability_score, specificity_score, realism_score,
+                    safety_score, learning_value_score, overall_score
+                )
+                VALUES {', '.join(values_clauses)}
+                ON CONFLICT (hypothesis_id) DO UPDATE SET
+                    testability_score = EXCLUDED.testability_score,
+                    specificity_score = EXCLUDED.specificity_score,
+                    realism_score = EXCLUDED.realism_score,
+                    safety_score = EXCLUDED.safety_score,
+                    learning_value_score = EXCLUDED.learning_value_score,
+                    overall_score = EXCLUDED.overall_score,
+                    evaluation_timestamp = CURRENT_TIMESTAMP
+                """
+
+                logger.debug("Executing batch UPSERT for %d evaluations", len(chunk))
+                response = execute_sql(sql, parameters)
+
+                # Check how many rows were affected
+                records_affected += response.get('numberOfRecordsUpdated', 0)
         
-        logger.info(f"Successfully batch inserted/updated {records_affected} evaluations")
+        logger.info("Successfully batch inserted/updated %d evaluations", records_affected)
         return {
             "success": True,
             "inserted_count": records_affected,
@@ -217,7 +378,7 @@ def batch_insert_hypothesis_evaluations(
         }
         
     except ValueError as e:
-        logger.error(f"Validation error in batch insert: {str(e)}")
+        logger.error("Validation error in batch insert: %s", e)
         return {
             "success": False,
             "error": f"Validation error: {str(e)}",
@@ -225,7 +386,7 @@ def batch_insert_hypothesis_evaluations(
             "message": "Failed to validate batch insert data"
         }
     except Exception as e:
-        logger.error(f"Error in batch insert: {str(e)}")
+        logger.error("Error in batch insert: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -252,19 +413,23 @@ def get_hypothesis_evaluations(
     Returns:
         Dict containing list of evaluations and query metadata
     """
-    logger.info(f"Getting hypothesis evaluations with filters - IDs: {hypothesis_ids}, score range: {min_overall_score}-{max_overall_score}")
+    logger.info("Getting hypothesis evaluations with filters - IDs: %s, score range: %s-%s", hypothesis_ids, min_overall_score, max_overall_score)
     
     try:
         # Build SQL query with optional filters
         where_conditions = []
         parameters = []
         
-        # Handle specific hypothesis IDs
+        # Handle specific hypothesis IDs. The whole list travels as one
+        # comma-joined parameter unpacked server-side — one bind instead of
+        # one per ID, so the SQL text is stable and long lists cannot hit
+        # the bind-parameter cap. (The Data API does not accept arrayValue
+        # as input, hence string_to_array rather than a native array bind.)
         if hypothesis_ids:
-            placeholders = ','.join([f':id_{i}' for i in range(len(hypothesis_ids))])
-            where_conditions.append(f"he.hypothesis_id IN ({placeholders})")
-            for i, hyp_id in enumerate(hypothesis_ids):
-                parameters.append(format_parameter(f'id_{i}', hyp_id))
+            where_conditions.append(
+                "he.hypothesis_id = ANY(string_to_array(:ids, ',')::bigint[])"
+            )
+            parameters.append(format_parameter('ids', ','.join(map(str, map(int, hypothesis_ids)))))
         
         # Handle score range filters
         if min_overall_score is not None:
@@ -296,26 +461,11 @@ def get_hypothesis_evaluations(
         logger.debug("Executing SQL SELECT for hypothesis evaluations")
         response = execute_sql(sql, parameters)
         
-        # Parse the response
-        evaluations = []
+        # Parse the response via the column tables
         records = response.get('records', [])
+        evaluations = [_parse_evaluation_record(record) for record in records]
         
-        for record in records:
-            evaluation = {
-                'id': record[0].get('longValue'),
-                'hypothesis_id': record[1].get('longValue'),
-                'hypothesis_title': record[2].get('stringValue', ''),
-                'testability_score': record[3].get('longValue'),
-                'specificity_score': record[4].get('longValue'),
-                'realism_score': record[5].get('longValue'),
-                'safety_score': record[6].get('longValue'),
-                'learning_value_score': record[7].get('longValue'),
-                'overall_score': float(record[8].get('doubleValue', 0)),
-                'evaluation_timestamp': record[9].get('stringValue', '')
-            }
-            evaluations.append(evaluation)
-        
-        logger.info(f"Retrieved {len(evaluations)} evaluations from database")
+        logger.info("Retrieved %d evaluations from database", len(evaluations))
         
         return {
             "success": True,
@@ -330,7 +480,7 @@ def get_hypothesis_evaluations(
         }
         
     except Exception as e:
-        logger.error(f"Error getting hypothesis evaluations: {str(e)}")
+        logger.error("Error getting hypothesis evaluations: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -10,23 +10,46 @@ logger = logging.getLogger(__name__)
 
 from typing import Any, Dict, List, Union, Optional
 
+# Optional speedup, same deal as observability.logging_utils: orjson
+# parses a few times faster than stdlib json, which shows up when many
+# resources carry large metadata blobs. Stdlib remains the fallback; the
+# bound decode method of a single decoder instance already beats
+# json.loads, which reconstructs its keyword handling on every call.
+try:
+    from orjson import loads as _JSON_DECODE
+except ImportError:
+    _JSON_DECODE = json.JSONDecoder().decode
+
+# Characters a valid JSON document can start with. Anything else fails the
+# decoder anyway, so it can be rejected without paying for the parse +
+# exception. Includes scalar starts (numbers, true/false/null), not just
+# containers, since JSONB columns can legally hold scalars.
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
 def safe_json_parse(field: Any, field_name: str, default: Optional[Union[Dict[str, Any], List[Any]]] = None) -> Union[Dict[str, Any], List[Any]]:
     """
     Safely parse JSON field from database response with error logging.
-    
+
     Args:
         field: Database field response
         field_name: Name of the field for error logging
         default: Default value if parsing fails
-        
+
     Returns:
         Parsed JSON data or default value
     """
-    if field and field.get('stringValue') and field['stringValue'].strip():
-        try:
-            return json.loads(field['stringValue'])
-        except (json.JSONDecodeError, ValueError) as e:
-            logger.warning(f"Failed to parse JSON for field '{field_name}': {e}")
-            logger.warning(f"Raw value: {field['stringValue'][:200]}...")
-            return default if default is not None else ([] if isinstance(default, list) else {})
-    return default if default is not None else ([] if isinstance(default, list) else {})
+    value = field.get('stringValue') if field else None
+    if value:
+        stripped = value.strip()
+        if stripped:
+            if stripped[0] not in _JSON_START_CHARS:
+                logger.warning("Field '%s' does not look like JSON", field_name)
+                logger.warning("Raw value: %.200s...", value)
+                return default if default is not None else {}
+            try:
+                return _JSON_DECODE(value)
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning("Failed to parse JSON for field '%s': %s", field_name, e)
+                logger.warning("Raw value: %.200s...", value)
+                return default if default is not None else {}
+    return default if default is not None else {}
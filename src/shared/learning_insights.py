@@ -6,7 +6,6 @@ Tools for managing learning insights in the database.
 from strands import tool
 import json
 import logging
-from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 try:
     from .database_connection import execute_sql, format_parameter
@@ -17,6 +16,37 @@ except ImportError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Column table for the learning-history SELECT, in record (column) order:
+# (output key, Data API field, default). Rows stay plain dicts because tool
+# results are JSON-serialized for the agents.
+_INSIGHT_COLUMNS = (
+    ('id', 'longValue', None),
+    ('experiment_id', 'longValue', None),
+    ('key_learnings', 'stringValue', ''),
+    ('recommendations', 'stringValue', ''),
+    ('refined_hypotheses', 'stringValue', ''),
+    ('risk_assessment', 'stringValue', ''),
+    ('knowledge_gaps', 'stringValue', ''),
+    ('follow_up_experiments', 'stringValue', ''),
+    ('created_at', 'stringValue', ''),
+    ('experiment_title', 'stringValue', ''),
+)
+_INSIGHT_KEYS = tuple(key for key, _, _ in _INSIGHT_COLUMNS)
+_INSIGHT_EXTRACTORS = tuple((field, default) for _, field, default in _INSIGHT_COLUMNS)
+
+def _parse_insight_record(record: list) -> Dict[str, Any]:
+    """
+    Build an insight dict from a Data API record.
+
+    One dict construction per row and one .get per cell, instead of a dict
+    literal with hand-numbered record indices.
+    """
+    return dict(zip(
+        _INSIGHT_KEYS,
+        (cell.get(field, default)
+         for (field, default), cell in zip(_INSIGHT_EXTRACTORS, record))
+    ))
+
 @tool
 def save_learning_insights(experiment_id: int, key_learnings: str, recommendations: str, 
                          refined_hypotheses: str, risk_assessment: str, 
@@ -36,7 +66,7 @@ def save_learning_insights(experiment_id: int, key_learnings: str, recommendatio
     Returns:
         Dictionary indicating success or failure
     """
-    logger.info(f"Saving learning insights for experiment ID: {experiment_id}")
+    logger.info("Saving learning insights for experiment ID: %s", experiment_id)
     
     try:
         # Insert the learning insights
@@ -67,17 +97,100 @@ def save_learning_insights(experiment_id: int, key_learnings: str, recommendatio
             'message': 'Learning insights saved successfully'
         }
         
-    except RuntimeError as e:
-        logger.error(f"Database error saving learning insights: {str(e)}")
+    except Exception as e:
+        # execute_sql already wraps database failures in RuntimeError, so a
+        # single handler covers both; logger.exception formats the traceback
+        # lazily and only when the level is enabled
+        logger.exception("Failed to save learning insights")
         return {
             'success': False,
             'error': f'Failed to save learning insights: {str(e)}'
         }
+
+
+@tool
+def save_insights_and_update_hypothesis(experiment_id: int, key_learnings: str,
+                                        recommendations: str, refined_hypotheses: str,
+                                        risk_assessment: str, knowledge_gaps: str,
+                                        follow_up_experiments: str, hypothesis_id: int,
+                                        status: str, learning_notes: str) -> Dict[str, Any]:
+    """
+    Save learning insights and update the related hypothesis in one call.
+
+    The typical analysis flow saves insights and then updates the hypothesis
+    status — two Data API round-trips. This tool issues both writes as a
+    single statement (insight INSERT in a data-modifying CTE, hypothesis
+    UPDATE as the main statement), halving the latency and making the pair
+    atomic.
+
+    Args:
+        experiment_id: ID of the related experiment
+        key_learnings: Main insights from the experiment
+        recommendations: Actionable recommendations
+        refined_hypotheses: Updated hypotheses based on findings
+        risk_assessment: Updated risk understanding
+        knowledge_gaps: Areas needing further investigation
+        follow_up_experiments: Suggested follow-up experiments
+        hypothesis_id: ID of the hypothesis to update
+        status: New hypothesis status (proposed, prioritized, validated, refuted, needs_refinement)
+        learning_notes: Notes about what was learned
+
+    Returns:
+        Dictionary indicating success or failure
+    """
+    logger.info("Saving insights for experiment %s and updating hypothesis %s to '%s'",
+                experiment_id, hypothesis_id, status)
+
+    try:
+        sql = """
+        WITH insight AS (
+            INSERT INTO learning_insights (
+                experiment_id, key_learnings, recommendations, refined_hypotheses,
+                risk_assessment, knowledge_gaps, follow_up_experiments
+            ) VALUES (
+                :experiment_id, :key_learnings, :recommendations, :refined_hypotheses,
+                :risk_assessment, :knowledge_gaps, :follow_up_experiments
+            )
+            RETURNING id
+        )
+        UPDATE hypothesis SET
+            status = :status, notes = :learning_notes, updated_at = CURRENT_TIMESTAMP
+        WHERE id = :hypothesis_id
+        """
+
+        parameters = [
+            format_parameter('experiment_id', experiment_id),
+            format_parameter('key_learnings', key_learnings),
+            format_parameter('recommendations', recommendations),
+            format_parameter('refined_hypotheses', refined_hypotheses),
+            format_parameter('risk_assessment', risk_assessment),
+            format_parameter('knowledge_gaps', knowledge_gaps),
+            format_parameter('follow_up_experiments', follow_up_experiments),
+            format_parameter('status', status),
+            format_parameter('learning_notes', learning_notes),
+            format_parameter('hypothesis_id', hypothesis_id)
+        ]
+
+        response = execute_sql(sql, parameters)
+
+        hypothesis_updated = response.get('numberOfRecordsUpdated', 0) > 0
+        if not hypothesis_updated:
+            logger.warning("No hypothesis found with ID: %s", hypothesis_id)
+
+        return {
+            'success': True,
+            'hypothesis_id': hypothesis_id,
+            'hypothesis_updated': hypothesis_updated,
+            'message': 'Learning insights saved and hypothesis updated'
+                       if hypothesis_updated else
+                       'Learning insights saved; no hypothesis matched the given ID'
+        }
+
     except Exception as e:
-        logger.error(f"Unexpected error saving learning insights: {str(e)}")
+        logger.exception("Failed to save insights and update hypothesis")
         return {
             'success': False,
-            'error': f'Failed to save learning insights: {str(e)}'
+            'error': f'Failed to save insights and update hypothesis: {str(e)}'
         }
 
 
@@ -92,43 +205,32 @@ def get_learning_history(days_back: int = 30) -> Dict[str, Any]:
     Returns:
         Dictionary containing historical learning insights
     """
-    logger.info(f"Retrieving learning history for past {days_back} days")
+    logger.info("Retrieving learning history for past %d days", days_back)
     
     try:
-        # Calculate date threshold
-        threshold_date = (datetime.utcnow() - timedelta(days=days_back)).isoformat()
-        
+        # Threshold is computed server-side: the database clock stays
+        # authoritative, the statement text is identical across calls
+        # (cacheable plan), and no ISO string is built and re-parsed
         sql = """
-        SELECT li.*, e.title as experiment_title 
+        SELECT li.*, e.title as experiment_title
         FROM learning_insights li
         JOIN experiment e ON li.experiment_id = e.id
-        WHERE li.created_at >= :threshold_date
+        WHERE li.created_at >= NOW() - make_interval(days => :days_back)
         ORDER BY li.created_at DESC
         """
-        
+
         parameters = [
-            format_parameter('threshold_date', threshold_date)
+            format_parameter('days_back', days_back)
         ]
         
         response = execute_sql(sql, parameters)
         
-        # Convert response to readable format
-        insights = []
-        for record in response.get('records', []):
-            if len(record) > 0:
-                insight = {
-                    'id': record[0].get('longValue'),
-                    'experiment_id': record[1].get('longValue'),
-                    'experiment_title': record[9].get('stringValue', ''),
-                    'key_learnings': record[2].get('stringValue', ''),
-                    'recommendations': record[3].get('stringValue', ''),
-                    'refined_hypotheses': record[4].get('stringValue', ''),
-                    'risk_assessment': record[5].get('stringValue', ''),
-                    'knowledge_gaps': record[6].get('stringValue', ''),
-                    'follow_up_experiments': record[7].get('stringValue', ''),
-                    'created_at': record[8].get('stringValue', '')
-                }
-                insights.append(insight)
+        # Convert response to readable format via the column table
+        insights = [
+            _parse_insight_record(record)
+            for record in response.get('records', [])
+            if record
+        ]
         
         return {
             'success': True,
@@ -137,14 +239,8 @@ def get_learning_history(days_back: int = 30) -> Dict[str, Any]:
             'period_days': days_back
         }
         
-    except RuntimeError as e:
-        logger.error(f"Database error retrieving learning history: {str(e)}")
-        return {
-            'success': False,
-            'error': f'Failed to retrieve learning history: {str(e)}'
-        }
     except Exception as e:
-        logger.error(f"Unexpected error retrieving learning history: {str(e)}")
+        logger.exception("Failed to retrieve learning history")
         return {
             'success': False,
             'error': f'Failed to retrieve learning history: {str(e)}'
@@ -166,7 +262,7 @@ def update_hypothesis_status(hypothesis_id: int,
     Returns:
         Dictionary indicating success or failure
     """
-    logger.info(f"Updating hypothesis {hypothesis_id} status to '{status}'")
+    logger.info("Updating hypothesis %s status to '%s'", hypothesis_id, status)
     
     try:
         # Import the update_hypothesis function from hypotheses.py
@@ -192,7 +288,7 @@ def update_hypothesis_status(hypothesis_id: int,
             }
         
     except Exception as e:
-        logger.error(f"Unexpected error updating hypothesis status: {str(e)}")
+        logger.error("Unexpected error updating hypothesis status: %s", e)
         return {
             'success': False,
             'error': f'Failed to update hypothesis status: {str(e)}'
@@ -214,28 +310,20 @@ def get_experiment_results(experiment_id: Optional[int] = None,
     Returns:
         Dictionary containing experiment results and metadata
     """
-    logger.info(f"Retrieving experiment results - ID: {experiment_id}, Status: {status}, Limit: {limit}")
+    logger.info("Retrieving experiment results - ID: %s, Status: %s, Limit: %d", experiment_id, status, limit)
     
     try:
         # Import the get_experiments function from experiments.py
         from .experiments import get_experiments
-        
-        # Use the get_experiments function with appropriate parameters
+
+        # Filter server-side: get_experiments pushes the ID into the WHERE
+        # clause, so no rows are fetched just to be discarded here
         if experiment_id:
-            # For a specific experiment, we use hypothesis_id parameter
-            result = get_experiments(
-                hypothesis_id=None,  # Not filtering by hypothesis
+            return get_experiments(
+                experiment_id=experiment_id,
                 status_filter=status,
-                limit=1 if experiment_id else limit
+                limit=1
             )
-            
-            # Filter the results to get only the requested experiment
-            if result['success'] and result['experiments']:
-                experiments = [exp for exp in result['experiments'] if exp['id'] == experiment_id]
-                result['experiments'] = experiments
-                result['count'] = len(experiments)
-                
-            return result
         else:
             # For multiple experiments, just pass the status filter
             return get_experiments(
@@ -244,7 +332,7 @@ def get_experiment_results(experiment_id: Optional[int] = None,
             )
         
     except Exception as e:
-        logger.error(f"Unexpected error retrieving experiment results: {str(e)}")
+        logger.error("Unexpected error retrieving experiment results: %s", e)
         return {
             'success': False,
             'error': f'Failed to retrieve experiment results: {str(e)}',
@@ -2,6 +2,7 @@
 Custom logging handlers for agent observability.
 """
 
+import functools
 import logging
 import os
 import sys
@@ -13,12 +14,40 @@ from shared.observability.logging_utils import JSONFormatter
 from shared.config import get_log_level, get_log_file_path
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_writable_log_dir(log_dir: str) -> bool:
+    """
+    Create the log directory if needed and check it is writable.
+
+    Memoized per directory: multiple agents in one process share log
+    directories, so the makedirs and write check only need to run once
+    instead of per handler construction. os.access covers the common case
+    with a single stat; the test-write fallback catches filesystems where
+    the access bits lie (e.g. read-only mounts).
+    """
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+        if os.access(log_dir, os.W_OK):
+            return True
+
+        test_file = os.path.join(log_dir, '.write_test')
+        with open(test_file, 'w') as f:
+            f.write('test')
+        os.unlink(test_file)
+        return True
+    except Exception:
+        return False
+
+
 class StructuredLoggingHandler:
     """Custom handler for structured logging to files or stdout based on environment."""
     
     def __init__(self, agent_name: str):
         self.agent_name = agent_name
         self.logger = self._setup_logger()
+        # Pre-bound log method: the callback fires per token/tool step, so
+        # the attribute lookups should not be repaid on every event
+        self._log = self.logger.log if self.logger else None
     
     def _setup_logger(self):
         """Setup logger with appropriate output based on environment."""
@@ -55,17 +84,11 @@ class StructuredLoggingHandler:
             log_file = get_log_file_path(self.agent_name)
             if not log_file:
                 return logging.StreamHandler(sys.stderr)
-            
+
             log_dir = os.path.dirname(os.path.abspath(log_file))
-            if log_dir and log_dir != '.':
-                os.makedirs(log_dir, exist_ok=True)
-            
-            # Test write permissions
-            test_file = os.path.join(log_dir if log_dir else '.', f'.test_{self.agent_name}')
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.unlink(test_file)
-            
+            if not _ensure_writable_log_dir(log_dir):
+                return logging.StreamHandler(sys.stderr)
+
             return logging.FileHandler(log_file)
         except Exception:
             # Fallback to stderr to avoid interfering with agent stdout
@@ -75,13 +98,18 @@ class StructuredLoggingHandler:
         """Handle callback events by logging them."""
         if not self.logger:
             return
-        
-        # Log all callback data as structured information
-        log_level = "error" if any(key in kwargs for key in ['error', 'exception']) else "info"
-        
+
+        # Error events log at ERROR, everything else at INFO
+        level = logging.ERROR if ('error' in kwargs or 'exception' in kwargs) else logging.INFO
+
+        # Bail before building the extra dict when the record would be
+        # filtered anyway; this path runs thousands of times per agent run
+        if not self.logger.isEnabledFor(level):
+            return
+
         # Create log record with callback data
-        self.logger.log(
-            getattr(logging, log_level.upper()),
+        self._log(
+            level,
             "Agent callback event",
             extra={
                 'agent_name': self.agent_name,
@@ -2,62 +2,179 @@
 Logging utilities and container detection for observability system.
 """
 
+import atexit
+import functools
 import json
 import logging
 import os
+import queue
 import sys
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
+# orjson serializes several times faster than stdlib json and matters here
+# because every agent callback event becomes one formatted line. It is an
+# optional speedup, not a dependency: stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+if orjson is not None:
+    # Dataclasses, UUIDs and numpy arrays (tool_input/tool_output payloads)
+    # are serialized natively in C instead of bouncing through default=str
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_DATACLASS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NAIVE_UTC
+    )
+
+    def _dump_json(log_entry):
+        # orjson returns UTF-8 bytes; logging needs str
+        return orjson.dumps(log_entry, default=str, option=_ORJSON_OPTIONS).decode()
+else:
+    def _encoder_default(o):
+        # Explicit dispatch for the types that actually show up in log
+        # payloads; default=str alone funnels everything through the
+        # generic fallback and loses structure for plain objects
+        if isinstance(o, datetime):
+            return o.isoformat()
+        if isinstance(o, BaseException):
+            return str(o)
+        d = getattr(o, '__dict__', None)
+        if d is not None:
+            return d
+        return str(o)
+
+    # Bound encode method of a single encoder instance; json.dumps would
+    # rebuild the encoder on every record
+    _dump_json = json.JSONEncoder(ensure_ascii=False, default=_encoder_default).encode
+
+
+# Second-resolution timestamp prefix cache. Records logged within the same
+# second share the strftime result and only the microsecond suffix is
+# formatted per record, instead of constructing a datetime and running
+# isoformat each time. A stale read under threads just redoes the strftime.
+_last_sec = 0
+_last_prefix = ''
+
+def _format_timestamp(created: float) -> str:
+    global _last_sec, _last_prefix
+    sec = int(created)
+    if sec != _last_sec:
+        _last_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))
+        _last_sec = sec
+    return f"{_last_prefix}.{int((created - sec) * 1e6):06d}Z"
+
+
+# Extra fields copied into log entries when present on the record, in the
+# fixed order they appear in the output line. Iterating this tuple with a
+# membership test per name replaces the hasattr+getattr pair per field,
+# and — unlike a set intersection — emits extras in the same order every
+# run, so downstream consumers that infer schemas from field order
+# (aggregators, Athena/Glue) see a stable layout.
+_EXTRA_FIELDS = (
+    'agent', 'agent_name', 'execution_id', 'tool_name', 'tool_use_id',
+    'tool_input', 'tool_output', 'duration_ms', 'error', 'callback_data',
+)
+
+# A record logged without extra= carries exactly the stock LogRecord
+# attributes, so an O(1) length check screens out the common no-extras
+# case before any set work happens
+_BASE_RECORD_SIZE = len(logging.LogRecord('', 0, '', 0, '', None, None).__dict__)
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
-    
+
     def format(self, record):
         log_entry = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _format_timestamp(record.created),
             'level': record.levelname,
             'component': record.name,
             'message': record.getMessage(),
         }
         
-        # Add extra fields dynamically
-        for field in ['agent', 'execution_id', 'duration_ms', 'tool_name', 
-                     'tool_use_id', 'error', 'tool_input', 'tool_output',
-                     'agent_name', 'callback_data']:
-            if hasattr(record, field):
-                log_entry[field] = getattr(record, field)
+        # Add extra fields dynamically; most records carry none
+        record_dict = record.__dict__
+        if len(record_dict) > _BASE_RECORD_SIZE:
+            for field in _EXTRA_FIELDS:
+                if field in record_dict:
+                    log_entry[field] = record_dict[field]
         
         if record.exc_info:
             log_entry['exception'] = self.formatException(record.exc_info)
-            
-        return json.dumps(log_entry, default=str, ensure_ascii=False)
 
+        return _dump_json(log_entry)
+
+
+# Shared queue and drain thread for component loggers. The calling thread
+# only enqueues the record; JSON formatting and the stderr write syscall
+# happen on the listener thread, so bursty logging (agent tool callbacks)
+# no longer blocks the work being logged. One listener serves every
+# component logger in the process.
+_log_queue = None
+_log_listener = None
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The stock prepare() pre-formats the record on the producing thread,
+    bakes any traceback into the message and clears exc_info - which
+    would both defeat moving the formatting work off-thread and stop the
+    listener's JSONFormatter from emitting the structured exception
+    field. The queue is in-process and records are never pickled, so the
+    record can travel as-is.
+    """
+
+    def prepare(self, record):
+        return record
 
+
+def _get_queue_handler() -> QueueHandler:
+    global _log_queue, _log_listener
+
+    if _log_queue is None:
+        _log_queue = queue.SimpleQueue()
+        # Use stderr to avoid interfering with agent stdout
+        stream_handler = logging.StreamHandler(sys.stderr)
+        stream_handler.setFormatter(JSONFormatter())
+        _log_listener = QueueListener(_log_queue, stream_handler)
+        _log_listener.start()
+        # Drain any queued records before interpreter shutdown
+        atexit.register(_log_listener.stop)
+
+    return _PassthroughQueueHandler(_log_queue)
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(component_name: str) -> logging.Logger:
     """
     Get configured logger for non-agent components.
-    
+
+    Logger instances are process-wide singletons, so the result is
+    memoized per component name: the handler probe and the config-backed
+    get_log_level() call run once, and repeat calls are a cache hit.
+
     Args:
         component_name: Name of the component
-        
+
     Returns:
         Configured logger instance
     """
     from shared.config import get_log_level
-    
+
     logger = logging.getLogger(f"chaos_agent.{component_name}")
-    
+
     if not logger.handlers:
-        # Use stderr to avoid interfering with agent stdout
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(JSONFormatter())
-        logger.addHandler(handler)
-        
+        logger.addHandler(_get_queue_handler())
+
         # Use centralized config for log level
         log_level = get_log_level()
         logger.setLevel(getattr(logging, log_level, logging.INFO))
         logger.propagate = False
-    
+
     return logger
@@ -6,38 +6,75 @@ Used by hypothesis generation agents to focus on deployed infrastructure.
 """
 from strands import tool
 import logging
+from collections import defaultdict
 from typing import Dict, Any
-from .database_connection import execute_sql
+from .database_connection import execute_sql, format_parameter
 from .json_utils import safe_json_parse
 
 logger = logging.getLogger(__name__)
 
-@tool
-def get_deployed_resources() -> Dict[str, Any]:
-    """Get only deployed AWS resources for hypothesis generation."""
-    logger.info("Getting deployed AWS resources for hypothesis generation")
-    
-    try:
-        sql = """
+def _string_value(field, default=''):
+    """Safely extract a stringValue from a Data API cell."""
+    return field.get('stringValue', default) if field else default
+
+# Hoisted so every call sends byte-identical statement text, which the
+# server-side plan cache can key on
+# The trailing ->> columns pre-extract the hot metadata sub-fields with
+# Postgres's C-level JSONB code, so they are usable even when the blob
+# itself fails to parse client-side
+_DEPLOYED_RESOURCES_SQL = """
         SELECT resource_type, resource_id, resource_metadata, analysis_results,
-               aws_account_id, region, created_at
+               aws_account_id, region, created_at,
+               resource_metadata->>'deployment_type',
+               resource_metadata->>'namespace',
+               resource_metadata->>'cluster_name'
         FROM aws_resource_analysis
         WHERE deployment_status = 'deployed'
         ORDER BY created_at DESC
         """
-        
-        response = execute_sql(sql)
+
+_DEPLOYED_RESOURCES_BY_TYPE_SQL = """
+        SELECT resource_type, resource_id, resource_metadata, analysis_results,
+               aws_account_id, region, created_at,
+               resource_metadata->>'deployment_type',
+               resource_metadata->>'namespace',
+               resource_metadata->>'cluster_name'
+        FROM aws_resource_analysis
+        WHERE deployment_status = 'deployed'
+          AND resource_type = :resource_type
+        ORDER BY created_at DESC
+        """
+
+@tool
+def get_deployed_resources(resource_type: str = None) -> Dict[str, Any]:
+    """
+    Get only deployed AWS resources for hypothesis generation.
+
+    Args:
+        resource_type: Optional resource type to filter by (e.g. 'eks_service').
+                       When set, the filter runs server-side so only matching
+                       rows cross the wire.
+    """
+    logger.info("Getting deployed AWS resources for hypothesis generation")
+    
+    try:
+        if resource_type:
+            response = execute_sql(
+                _DEPLOYED_RESOURCES_BY_TYPE_SQL,
+                [format_parameter('resource_type', resource_type)]
+            )
+        else:
+            response = execute_sql(_DEPLOYED_RESOURCES_SQL)
         records = response.get('records', [])
         
         if not records:
             return {"success": False, "message": "No deployed resources found", "resources": []}
         
         deployed_resources = []
+        # Grouped by deployment type for easier analysis, populated in the
+        # same pass that parses the records
+        resources_by_type = defaultdict(list)
         for record in records:
-            # Safely extract field values
-            def get_field_value(field, default=''):
-                return field.get('stringValue', default) if field and isinstance(field, dict) else default
-            
             resource_metadata_raw = safe_json_parse(record[2], 'resource_metadata', {})
             analysis_results_raw = safe_json_parse(record[3], 'analysis_results', {})
             
@@ -46,36 +83,29 @@ def get_deployed_resources() -> Dict[str, Any]:
             analysis_results: Dict[str, Any] = analysis_results_raw if isinstance(analysis_results_raw, dict) else {}
             
             resource = {
-                'resource_type': get_field_value(record[0]),
-                'resource_id': get_field_value(record[1]),
+                'resource_type': _string_value(record[0]),
+                'resource_id': _string_value(record[1]),
                 'resource_metadata': resource_metadata,
                 'analysis_results': analysis_results,
-                'aws_account_id': get_field_value(record[4]) or None,
-                'region': get_field_value(record[5]) or None,
-                'created_at': get_field_value(record[6]),
-                # Extract key metadata for easy access
-                'deployment_type': resource_metadata.get('deployment_type'),
-                'namespace': resource_metadata.get('namespace'),  # Critical for EKS
-                'cluster_name': resource_metadata.get('cluster_name')
+                'aws_account_id': _string_value(record[4]) or None,
+                'region': _string_value(record[5]) or None,
+                'created_at': _string_value(record[6]),
+                # Key metadata extracted server-side for easy access
+                'deployment_type': record[7].get('stringValue') if record[7] else None,
+                'namespace': record[8].get('stringValue') if record[8] else None,  # Critical for EKS
+                'cluster_name': record[9].get('stringValue') if record[9] else None
             }
             deployed_resources.append(resource)
-        
-        # Group by deployment type for easier analysis
-        resources_by_type = {}
-        for resource in deployed_resources:
-            resource_type = resource['resource_type']
-            if resource_type not in resources_by_type:
-                resources_by_type[resource_type] = []
-            resources_by_type[resource_type].append(resource)
-        
+            resources_by_type[resource['resource_type']].append(resource)
+
         return {
             "success": True,
             "message": f"Retrieved {len(deployed_resources)} deployed resources",
             "resources": deployed_resources,
-            "resources_by_type": resources_by_type,
+            "resources_by_type": dict(resources_by_type),
             "total_count": len(deployed_resources)
         }
         
     except Exception as e:
-        logger.error(f"Error getting deployed resources: {str(e)}")
+        logger.error("Error getting deployed resources: %s", e)
         return {"success": False, "error": str(e), "message": "Failed to get deployed resources", "resources": []}
@@ -4,40 +4,59 @@ Resource Tags Configuration Management for Chaos Agent System
 This module provides tag-based resource filtering capabilities for chaos engineering.
 Tags are set via prompts/inputs and used to filter AWS resources during experiments.
 """
+import functools
 import os
 import logging
-from typing import List, Dict, Optional
+import re
+from contextvars import ContextVar
+from typing import List, Dict, Optional, Tuple
 from strands import tool
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Global configuration cache
-_tags_cache = {}
+# Configured workload tags as an immutable item tuple; None means "not yet
+# configured". The process-wide store is a module global because the
+# strands runtime executes agent loops and tool calls on worker threads,
+# where a value set through a ContextVar in the caller's context would not
+# be visible - and a silently empty tag set widens the blast radius the
+# tags exist to limit. The ContextVar is only a per-context override for
+# callers that need a different scope within one execution context.
+_process_tags: Optional[Tuple[Tuple[str, str], ...]] = None
+_context_tags: ContextVar[Optional[Tuple[Tuple[str, str], ...]]] = ContextVar(
+    'workload_tags_override', default=None
+)
+
+# A simple "key=value" / "key:value" token: no whitespace or separator
+# characters on either side. Tokens that don't fully match (e.g. values
+# containing spaces) fall back to the split-based parser.
+_TAG_PAIR_RE = re.compile(r'\s*([^\s,=:]+)\s*[=:]\s*([^\s,=:]+)\s*')
 
 @tool
-def get_workload_tags() -> List[Dict[str, str]]:
+def get_workload_tags() -> Dict[str, str]:
     """
     Get workload tags for resource filtering.
     
     Returns:
-        List[Dict[str, str]]: List of tag key-value pairs for filtering resources.
-                             Empty list if no tags are configured.
+        Dict[str, str]: Tag key-value pairs for filtering resources.
+                        Empty dict if no tags are configured.
     """
-    global _tags_cache
-    
-    # Check cache first
-    if 'workload_tags' in _tags_cache:
-        return _tags_cache['workload_tags']
+    global _process_tags
+
+    tags = _context_tags.get()
+    if tags is None:
+        tags = _process_tags
+    if tags is not None:
+        return dict(tags)
     
-    # Return empty list if no tags configured (default behavior)
+    # Return empty dict if no tags configured (default behavior)
     logger.info("No workload tags configured - will consider all resources")
-    _tags_cache['workload_tags'] = []
-    return []
+    _process_tags = ()
+    return {}
 
-def parse_tags_string(tags_string: str) -> List[Dict[str, str]]:
+def parse_tags_string(tags_string: str) -> Dict[str, str]:
     """
-    Parse a tags string into a list of tag dictionaries.
+    Parse a tags string into a tag dictionary.
     
     Supports formats:
     - "Environment=prod,Application=retail-store"
@@ -48,24 +67,36 @@ def parse_tags_string(tags_string: str) -> List[Dict[str, str]]:
         tags_string: String representation of tags
         
     Returns:
-        List[Dict[str, str]]: Parsed tags
+        Dict[str, str]: Parsed tags (later duplicates of a key win)
         
     Raises:
         ValueError: If tags string format is invalid
     """
+    # The same few tag strings arrive repeatedly (CLI args, prompts), so
+    # the parse is memoized on an immutable item tuple; each caller gets a
+    # fresh dict it is free to mutate.
+    return dict(_parse_tags_cached(tags_string))
+
+@functools.lru_cache(maxsize=128)
+def _parse_tags_cached(tags_string: str) -> tuple:
     if not tags_string or not tags_string.strip():
-        return []
-    
-    tags = []
-    
+        return ()
+
     # Split by comma first, then by space as fallback
-    tag_pairs = []
-    if ',' in tags_string:
-        tag_pairs = [pair.strip() for pair in tags_string.split(',')]
-    else:
-        tag_pairs = [pair.strip() for pair in tags_string.split()]
-    
-    for pair in tag_pairs:
+    separator = ',' if ',' in tags_string else None
+    raw_pairs = [pair for pair in tags_string.split(separator) if pair.strip()]
+
+    # Fast path: each token is one fullmatch against the compiled pattern
+    # (a single C-level scan) instead of two splits and three strips. Any
+    # token the pattern rejects drops to the loop below, which also raises
+    # the precise ValueError for genuinely malformed input.
+    matches = [_TAG_PAIR_RE.fullmatch(pair) for pair in raw_pairs]
+    if all(matches):
+        return tuple((m.group(1), m.group(2)) for m in matches)
+
+    tags = {}
+
+    for pair in (p.strip() for p in raw_pairs):
         if not pair:
             continue
             
@@ -83,9 +114,9 @@ def parse_tags_string(tags_string: str) -> List[Dict[str, str]]:
         if not key or not value:
             raise ValueError(f"Invalid tag format: '{pair}'. Key and value cannot be empty")
         
-        tags.append({key: value})
+        tags[key] = value
     
-    return tags
+    return tuple(tags.items())
 
 def set_workload_tags_from_string(tags_string: str) -> None:
     """
@@ -94,26 +125,26 @@ def set_workload_tags_from_string(tags_string: str) -> None:
     Args:
         tags_string: String representation of tags (e.g., "Environment=prod,Application=web")
     """
-    global _tags_cache
-    
     tags = parse_tags_string(tags_string)
     
-    # Store in cache
-    _tags_cache['workload_tags'] = tags
+    global _process_tags
+    _process_tags = tuple(tags.items())
     
-    logger.info(f"Workload tags set to: {tags}")
+    logger.info("Workload tags set to: %s", tags)
 
 def clear_workload_tags() -> None:
     """Clear workload tags (useful for testing)."""
-    global _tags_cache
-    if 'workload_tags' in _tags_cache:
-        del _tags_cache['workload_tags']
+    global _process_tags
+    _process_tags = None
+    _context_tags.set(None)
     logger.info("Workload tags cleared")
 
 
 
 def clear_tags_cache() -> None:
     """Clear the tags configuration cache (useful for testing)."""
-    global _tags_cache
-    _tags_cache.clear()
+    global _process_tags
+    _process_tags = None
+    _context_tags.set(None)
+    _parse_tags_cached.cache_clear()
     logger.debug("Tags configuration cache cleared")
@@ -11,6 +11,36 @@ from .database_connection import execute_sql, format_parameter
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT statement, keeping each request comfortably
+# under the Data API parameter and payload caps. batch_execute_statement
+# is avoided for inserts because Aurora PostgreSQL does not populate
+# generatedFields in its response, which would lose the RETURNING ids.
+_MAX_BATCH_ROWS = 500
+
+# Single-row insert; RETURNING id surfaces the generated key
+_INSERT_COMPONENT_ROW_SQL = """
+        INSERT INTO system_component (name, type, description)
+        VALUES (:name, :type, :description)
+        RETURNING id
+        """
+
+# Component SELECTs with and without the type filter, hoisted so repeat
+# calls reuse identical statement text
+_SELECT_COMPONENTS_SQL = """
+        SELECT id, name, type, description, created_at, updated_at
+        FROM system_component
+        ORDER BY name
+        LIMIT :limit
+        """
+
+_SELECT_COMPONENTS_BY_TYPE_SQL = """
+        SELECT id, name, type, description, created_at, updated_at
+        FROM system_component
+        WHERE type = :component_type
+        ORDER BY name
+        LIMIT :limit
+        """
+
 @tool
 def insert_system_component(
     name: str,
@@ -28,16 +58,10 @@ def insert_system_component(
     Returns:
         The ID of the inserted system component, or None if insertion failed
     """
-    logger.info(f"Inserting new system component: '{name}' of type '{component_type}'")
+    logger.info("Inserting new system component: '%s' of type '%s'", name, component_type)
     
     try:
         # Insert new system component
-        sql = """
-        INSERT INTO system_component (name, type, description)
-        VALUES (:name, :type, :description)
-        RETURNING id
-        """
-        
         parameters = [
             format_parameter('name', name),
             format_parameter('type', component_type),
@@ -45,19 +69,19 @@ def insert_system_component(
         ]
         
         logger.debug("Executing INSERT for system component")
-        response = execute_sql(sql, parameters)
+        response = execute_sql(_INSERT_COMPONENT_ROW_SQL, parameters)
         
         # Extract component ID from response
         component_id = response['records'][0][0]['longValue']
-        logger.info(f"Successfully inserted system component with ID: {component_id}")
+        logger.info("Successfully inserted system component with ID: %s", component_id)
         
         return component_id
         
     except RuntimeError as e:
-        logger.error(f"Database error inserting system component: {str(e)}")
+        logger.error("Database error inserting system component: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Unexpected error inserting system component: {str(e)}")
+        logger.error("Unexpected error inserting system component: %s", e)
         return None
 
 @tool
@@ -79,7 +103,7 @@ def update_system_component(
     Returns:
         True if update was successful, False otherwise
     """
-    logger.info(f"Updating system component ID: {component_id}")
+    logger.info("Updating system component ID: %s", component_id)
     
     try:
         # Build dynamic UPDATE query based on provided parameters
@@ -121,17 +145,17 @@ def update_system_component(
         records_updated = response.get('numberOfRecordsUpdated', 0)
         
         if records_updated > 0:
-            logger.info(f"Successfully updated system component with ID: {component_id}")
+            logger.info("Successfully updated system component with ID: %s", component_id)
             return True
         else:
-            logger.warning(f"No system component found with ID: {component_id}")
+            logger.warning("No system component found with ID: %s", component_id)
             return False
         
     except RuntimeError as e:
-        logger.error(f"Database error updating system component: {str(e)}")
+        logger.error("Database error updating system component: %s", e)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error updating system component: {str(e)}")
+        logger.error("Unexpected error updating system component: %s", e)
         return False
 
 @tool
@@ -149,29 +173,18 @@ def get_system_components(
     Returns:
         Dict containing list of system components and query metadata
     """
-    logger.info(f"Getting system components with type filter: {component_type}")
+    logger.info("Getting system components with type filter: %s", component_type)
     
     try:
-        # Build SQL query with optional type filter
+        # Pick the precompiled statement for the optional type filter
         if component_type:
-            sql = """
-            SELECT id, name, type, description, created_at, updated_at
-            FROM system_component
-            WHERE type = :component_type
-            ORDER BY name
-            LIMIT :limit
-            """
+            sql = _SELECT_COMPONENTS_BY_TYPE_SQL
             parameters = [
                 format_parameter('component_type', component_type),
                 format_parameter('limit', limit)
             ]
         else:
-            sql = """
-            SELECT id, name, type, description, created_at, updated_at
-            FROM system_component
-            ORDER BY name
-            LIMIT :limit
-            """
+            sql = _SELECT_COMPONENTS_SQL
             parameters = [
                 format_parameter('limit', limit)
             ]
@@ -180,11 +193,9 @@ def get_system_components(
         response = execute_sql(sql, parameters)
         
         # Parse the response
-        components = []
         records = response.get('records', [])
-        
-        for record in records:
-            component = {
+        components = [
+            {
                 'id': record[0].get('longValue'),
                 'name': record[1].get('stringValue', ''),
                 'type': record[2].get('stringValue', ''),
@@ -192,9 +203,10 @@ def get_system_components(
                 'created_at': record[4].get('stringValue', ''),
                 'updated_at': record[5].get('stringValue', '')
             }
-            components.append(component)
+            for record in records
+        ]
         
-        logger.info(f"Retrieved {len(components)} system components from database")
+        logger.info("Retrieved %d system components from database", len(components))
         
         return {
             "success": True,
@@ -205,7 +217,7 @@ def get_system_components(
         }
         
     except RuntimeError as e:
-        logger.error(f"Database error getting system components: {str(e)}")
+        logger.error("Database error getting system components: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -214,7 +226,7 @@ def get_system_components(
             "message": "Failed to get system components from database"
         }
     except Exception as e:
-        logger.error(f"Unexpected error getting system components: {str(e)}")
+        logger.error("Unexpected error getting system components: %s", e)
         return {
             "success": False,
             "error": f"Unexpected error: {str(e)}",
@@ -242,7 +254,7 @@ def batch_insert_system_components(
     Returns:
         Dict containing success status, inserted count, and component IDs
     """
-    logger.info(f"Batch inserting {len(components)} system components")
+    logger.info("Batch inserting %d system components", len(components))
     
     try:
         if not components:
@@ -266,50 +278,65 @@ def batch_insert_system_components(
             if not isinstance(component['type'], str) or not component['type'].strip():
                 raise ValueError(f"Component {i} has invalid type")
         
-        # Build batch INSERT with VALUES clause
-        values_clauses = []
-        parameters = []
-        
-        for i, component in enumerate(components):
-            # Set defaults for optional fields
-            name = component['name']
-            component_type = component['type']
-            description = component.get('description')
-            
-            # Create parameter placeholders for this component
-            values_clauses.append(f"(:name_{i}, :type_{i}, :description_{i})")
-            
-            # Add parameters for this component
-            parameters.extend([
-                format_parameter(f'name_{i}', name),
-                format_parameter(f'type_{i}', component_type),
-                format_parameter(f'description_{i}', description)
-            ])
-        
-        # Create the batch insert SQL
-        sql = f"""
-        INSERT INTO system_component (name, type, description)
-        VALUES {', '.join(values_clauses)}
-        RETURNING id
-        """
-        
-        logger.debug(f"Executing batch INSERT for {len(components)} system components")
-        response = execute_sql(sql, parameters)
-        
-        # Extract component IDs from response
         component_ids = []
-        records = response.get('records', [])
-        
-        for record in records:
-            if record and len(record) > 0:
-                component_id = record[0].get('longValue')
-                if component_id:
-                    component_ids.append(component_id)
+
+        # Chunked multi-row INSERT; RETURNING id comes back as ordinary
+        # records, which works on Aurora PostgreSQL where
+        # batch_execute_statement would drop the generated keys.
+        # Placeholders and parameters are built as single comprehensions.
+        for start in range(0, len(components), _MAX_BATCH_ROWS):
+            chunk = components[start:start + _MAX_BATCH_ROWS]
+            values_sql = ', '.join(
+                f"(:name_{i}, :type_{i}, :description_{i})"
+                for i in range(len(chunk))
+            )
+            parameters = [
+                param
+                for i, component in enumerate(chunk)
+                for param in (
+                    format_parameter(f'name_{i}', component['name']),
+                    format_parameter(f'type_{i}', component['type']),
+                    format_parameter(f'description_{i}', component.get('description'))
+                )
+            ]
+
+            sql = f"""
+            INSERT INTO system_component (name, type, description)
+            VALUES {values_sql}
+            RETURNING id
+            """
+
+            logger.debug("Executing batch INSERT for %d system components", len(chunk))
+            try:
+                response = execute_sql(sql, parameters)
+            except Exception as e:
+                # Chunks commit as they execute, so rows from earlier chunks
+                # are already in the database. Report them so a retrying
+                # caller re-submits only what is missing; a first-chunk
+                # failure falls through to the normal error handling.
+                if not component_ids:
+                    raise
+                logger.error("Database error after %d system components were inserted: %s", len(component_ids), e)
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "inserted_count": len(component_ids),
+                    "requested_count": len(components),
+                    "component_ids": component_ids,
+                    "message": f"Database error after inserting {len(component_ids)} of {len(components)} system components; the returned IDs are already in the database"
+                }
+
+            # Extract component IDs from response
+            for record in response.get('records', []):
+                if record and len(record) > 0:
+                    component_id = record[0].get('longValue')
+                    if component_id:
+                        component_ids.append(component_id)
         
         inserted_count = len(component_ids)
         
         if inserted_count > 0:
-            logger.info(f"Successfully batch inserted {inserted_count} system components")
+            logger.info("Successfully batch inserted %d system components", inserted_count)
             return {
                 "success": True,
                 "inserted_count": inserted_count,
@@ -329,7 +356,7 @@ def batch_insert_system_components(
             }
         
     except ValueError as e:
-        logger.error(f"Validation error in batch insert: {str(e)}")
+        logger.error("Validation error in batch insert: %s", e)
         return {
             "success": False,
             "error": f"Validation error: {str(e)}",
@@ -338,7 +365,7 @@ def batch_insert_system_components(
             "message": "Failed to validate batch insert data"
         }
     except RuntimeError as e:
-        logger.error(f"Database error in batch insert: {str(e)}")
+        logger.error("Database error in batch insert: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -347,7 +374,7 @@ def batch_insert_system_components(
             "message": "Database error during batch insert"
         }
     except Exception as e:
-        logger.error(f"Unexpected error in batch insert: {str(e)}")
+        logger.error("Unexpected error in batch insert: %s", e)
         return {
             "success": False,
             "error": f"Unexpected error: {str(e)}",
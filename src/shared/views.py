@@ -5,12 +5,40 @@ Tools for accessing database views that provide joined data.
 """
 from strands import tool
 import logging
+import operator
 from typing import Dict, Any, List, Optional
 from .database_connection import execute_sql, format_parameter
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# C-implemented cell extractors: methodcaller skips the Python-level
+# attribute dispatch that a bound .get call per cell per row would pay
+_get_long = operator.methodcaller('get', 'longValue')
+_get_str = operator.methodcaller('get', 'stringValue', '')
+
+def _opt_str(field):
+    """stringValue for nullable columns: None when the cell is absent."""
+    return field.get('stringValue', '') if field else None
+
+# Statement pieces hoisted so each filter combination produces the same
+# statement text on every call
+_EXPERIMENTS_BASE_SQL = """
+        SELECT id, title, description, experiment_plan, status,
+               scheduled_for, executed_at, completed_at, created_at,
+               hypothesis_title, hypothesis_description, hypothesis_status,
+               component_name, component_type
+        FROM experiment_with_hypothesis
+        """
+
+_WHERE_FRAGMENTS = {
+    'status': "status = :status",
+    'hypothesis_status': "hypothesis_status = :hypothesis_status",
+    'component_type': "component_type = :component_type",
+}
+
+_ORDER_LIMIT_SQL = " ORDER BY created_at DESC LIMIT :limit"
+
 @tool
 def get_experiments_with_context(
     status_filter: Optional[str] = None,
@@ -33,7 +61,7 @@ def get_experiments_with_context(
     Returns:
         Dict containing list of experiments with full context and query metadata
     """
-    logger.info(f"Getting experiments with context - status: {status_filter}, hypothesis_status: {hypothesis_status_filter}, component_type: {component_type_filter}")
+    logger.info("Getting experiments with context - status: %s, hypothesis_status: %s, component_type: %s", status_filter, hypothesis_status_filter, component_type_filter)
     
     try:
         # Build SQL query with optional filters
@@ -41,61 +69,51 @@ def get_experiments_with_context(
         parameters = []
         
         if status_filter:
-            where_conditions.append("status = :status")
+            where_conditions.append(_WHERE_FRAGMENTS['status'])
             parameters.append(format_parameter('status', status_filter))
-        
+
         if hypothesis_status_filter:
-            where_conditions.append("hypothesis_status = :hypothesis_status")
+            where_conditions.append(_WHERE_FRAGMENTS['hypothesis_status'])
             parameters.append(format_parameter('hypothesis_status', hypothesis_status_filter))
-        
+
         if component_type_filter:
-            where_conditions.append("component_type = :component_type")
+            where_conditions.append(_WHERE_FRAGMENTS['component_type'])
             parameters.append(format_parameter('component_type', component_type_filter))
-        
-        # Query the view
-        base_sql = """
-        SELECT id, title, description, experiment_plan, status, 
-               scheduled_for, executed_at, completed_at, created_at,
-               hypothesis_title, hypothesis_description, hypothesis_status,
-               component_name, component_type
-        FROM experiment_with_hypothesis
-        """
-        
+
+        # Assemble from the precompiled pieces
         if where_conditions:
-            sql = base_sql + " WHERE " + " AND ".join(where_conditions)
+            sql = _EXPERIMENTS_BASE_SQL + " WHERE " + " AND ".join(where_conditions) + _ORDER_LIMIT_SQL
         else:
-            sql = base_sql
-        
-        sql += " ORDER BY created_at DESC LIMIT :limit"
+            sql = _EXPERIMENTS_BASE_SQL + _ORDER_LIMIT_SQL
+
         parameters.append(format_parameter('limit', limit))
         
         logger.debug("Executing SQL SELECT from experiment_with_hypothesis view")
         response = execute_sql(sql, parameters)
         
         # Parse the response
-        experiments = []
         records = response.get('records', [])
-        
-        for record in records:
-            experiment = {
-                'id': record[0].get('longValue'),
-                'title': record[1].get('stringValue', ''),
-                'description': record[2].get('stringValue', ''),
-                'experiment_plan': record[3].get('stringValue', ''),
-                'status': record[4].get('stringValue', ''),
-                'scheduled_for': record[5].get('stringValue', '') if record[5] else None,
-                'executed_at': record[6].get('stringValue', '') if record[6] else None,
-                'completed_at': record[7].get('stringValue', '') if record[7] else None,
-                'created_at': record[8].get('stringValue', ''),
-                'hypothesis_title': record[9].get('stringValue', '') if record[9] else None,
-                'hypothesis_description': record[10].get('stringValue', '') if record[10] else None,
-                'hypothesis_status': record[11].get('stringValue', '') if record[11] else None,
-                'component_name': record[12].get('stringValue', '') if record[12] else None,
-                'component_type': record[13].get('stringValue', '') if record[13] else None
+        experiments = [
+            {
+                'id': _get_long(record[0]),
+                'title': _get_str(record[1]),
+                'description': _get_str(record[2]),
+                'experiment_plan': _get_str(record[3]),
+                'status': _get_str(record[4]),
+                'scheduled_for': _opt_str(record[5]),
+                'executed_at': _opt_str(record[6]),
+                'completed_at': _opt_str(record[7]),
+                'created_at': _get_str(record[8]),
+                'hypothesis_title': _opt_str(record[9]),
+                'hypothesis_description': _opt_str(record[10]),
+                'hypothesis_status': _opt_str(record[11]),
+                'component_name': _opt_str(record[12]),
+                'component_type': _opt_str(record[13])
             }
-            experiments.append(experiment)
+            for record in records
+        ]
         
-        logger.info(f"Retrieved {len(experiments)} experiments with context from view")
+        logger.info("Retrieved %d experiments with context from view", len(experiments))
         
         return {
             "success": True,
@@ -110,7 +128,7 @@ def get_experiments_with_context(
         }
         
     except RuntimeError as e:
-        logger.error(f"Database error getting experiments with context: {str(e)}")
+        logger.error("Database error getting experiments with context: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -119,7 +137,7 @@ def get_experiments_with_context(
             "message": "Failed to get experiments with context from database"
         }
     except Exception as e:
-        logger.error(f"Unexpected error getting experiments with context: {str(e)}")
+        logger.error("Unexpected error getting experiments with context: %s", e)
         return {
             "success": False,
             "error": f"Unexpected error: {str(e)}",
@@ -5,6 +5,8 @@ This module implements the workflow pattern using AWS Strands to orchestrate
 the execution of specialized chaos engineering agents in sequence.
 """
 
+import functools
+
 from strands import Agent
 from strands_tools import workflow, file_read, use_aws, python_repl
 from shared.config import get_aws_region, get_default_model
@@ -12,76 +14,64 @@ from shared.resource_tags import set_workload_tags_from_string
 from shared.observability import get_callback, get_logger
 
 
-# Import agents
-from HypothesisGeneratorAgent.agent import agent as hypothesis_agent
-from HypothesisPrioritizationAgent.agent import agent as prioritization_agent
-from ExperimentDesignAgent.agent import agent as design_agent
-from ExperimentsAgent.agent import agent as experiments_agent
-from LearningAndIterationAgent.agent import agent as learning_agent
+# The specialist agents are not imported here: the workflow steps
+# reference them by dotted path (e.g. "src.HypothesisGeneratorAgent.agent")
+# and the workflow runtime loads each one on first use, so the
+# orchestrator's import no longer pays five agent constructions up front.
 
 # Use centralized configuration without modifying environment
 
-# Create a workflow agent
-workflow_agent = Agent(
-    model=get_default_model(),
-    tools=[workflow, file_read, use_aws, python_repl],
-    system_prompt="You are a chaos engineering workflow coordinator that orchestrates the execution of specialized agents for testing AWS workload resilience.",
-    callback_handler=get_callback("chaos-workflow")
-)
-
-def run_chaos_workflow(workload_repo=None, region=None, tags=None, top_experiments=3, verbose=False):
+@functools.lru_cache(maxsize=4)
+def _get_workflow_agent(model_id, region):
     """
-    Execute the complete chaos engineering workflow using the workflow pattern.
-    
-    Args:
-        workload_repo (str, optional): Repository URL for the workload to analyze.
-                                      Defaults to AWS Retail Store Sample App.
-        region (str, optional): AWS region where resources are deployed. If None, uses centralized config.
-        tags (str, optional): Tag string for resource filtering.
-                             Format: "Environment=prod,Application=web-app"
-        top_experiments (int, optional): Number of top priority experiments to execute. Defaults to 3.
-        verbose (bool, optional): Enable verbose logging. Defaults to False.
-    
-    Returns:
-        dict: The workflow results including all outputs from each step
+    Build (once per model/region pair) the coordinator agent.
+
+    Constructing the Agent at module scope meant every import of this
+    module paid for model-client setup and callback wiring, even imports
+    that never run a workflow. The factory is memoized so repeated calls
+    in a warm process (Lambda, API server) reuse the same agent, while a
+    changed model or region gets its own instance.
     """
-    # Use centralized region configuration if not provided
-    if region is None:
-        region = get_aws_region()
-    
-    # Set workload tags if provided
-    if tags:
-        set_workload_tags_from_string(tags)
-    
-    # Get workflow logger
-    logger = get_logger("workflow")
-    logger.info("Starting chaos engineering workflow", extra={
-        'workload_repo': workload_repo,
-        'region': region,
-        'tags': tags,
-        'top_experiments': top_experiments
-    })
-    
-    # Set default workload if not provided
-    if not workload_repo:
-        workload_repo = "https://github.com/aws-containers/retail-store-sample-app.git"
-    
-    # Define the workflow steps with dynamic inputs
-    chaos_workflow = [
-            {
-                "name": "hypothesis_generation",
-                "description": "Generate chaos engineering hypotheses by analyzing the AWS workload",
-                "agent": "src.HypothesisGeneratorAgent.agent",
-                "input": f"""
+    return Agent(
+        model=model_id,
+        tools=[workflow, file_read, use_aws, python_repl],
+        system_prompt="You are a chaos engineering workflow coordinator that orchestrates the execution of specialized agents for testing AWS workload resilience.",
+        callback_handler=get_callback("chaos-workflow")
+    )
+
+# The six workflow steps, hoisted to module scope. Only workload_repo,
+# region and top_experiments vary between runs, so the multi-KB prompt
+# text is built once at import and per-call rendering is a str.format of
+# the three placeholders instead of re-allocating the whole table.
+# Dependencies are declared explicitly so the workflow engine schedules
+# on the real data-flow graph rather than list order: any step whose
+# dependencies are satisfied is ready to dispatch. timeout_s is each
+# step's wall-clock budget for the workflow runtime: a wedged LLM call
+# or FIS poll should fail that step instead of hanging the whole chain,
+# so experiment_execution gets an hour and the analysis steps minutes.
+_CHAOS_WORKFLOW_TEMPLATE = (
+    {
+        "name": "hypothesis_generation",
+        "timeout_s": 600,
+        "dependencies": [],
+        "description": "Generate chaos engineering hypotheses by analyzing the AWS workload",
+        "agent": "src.HypothesisGeneratorAgent.agent",
+        "input": """
 Analyze the AWS workload repository ({workload_repo}).
+
+Check the database for existing hypotheses for this
+workload. If hypotheses already exist and the workload has not changed,
+reuse them instead of regenerating — only generate hypotheses for gaps.
 """,
-                "output_key": "hypotheses"
-            },
-            {
-                "name": "hypothesis_prioritization",
-                "description": "Prioritize the generated hypotheses based on impact and feasibility",
-                "agent": "src.HypothesisPrioritizationAgent.agent",
-                "input": """
+        "output_key": "hypotheses"
+    },
+    {
+        "name": "hypothesis_prioritization",
+        "timeout_s": 300,
+        "dependencies": ["hypothesis_generation"],
+        "description": "Prioritize the generated hypotheses based on impact and feasibility",
+        "agent": "src.HypothesisPrioritizationAgent.agent",
+        "input": """
 Prioritize all hypotheses in the database based on:
 
 1. Business impact (customer experience, revenue impact)
@@ -92,95 +82,102 @@ Prioritize all hypotheses in the database based on:
 Update each hypothesis with a priority ranking from 1 to N (1 = highest priority).
 Focus on experiments that provide maximum learning with acceptable risk.
 """,
-                "output_key": "prioritized_hypotheses"
-            },
-            {
-                "name": "experiment_design",
-                "description": "Design AWS FIS experiments based on the prioritized hypotheses",
-                "agent": "src.ExperimentDesignAgent.agent",
-                "input": """
+        "output_key": "prioritized_hypotheses"
+    },
+    {
+        "name": "experiment_design",
+        "timeout_s": 900,
+        "dependencies": ["hypothesis_prioritization"],
+        "description": "Design AWS FIS experiments based on the prioritized hypotheses",
+        "agent": "src.ExperimentDesignAgent.agent",
+        "input": """
 Retrieve all hypotheses from the database (ordered by priority) and create experiment designs for each.
 Make sure to look up the latest documentation for each experiment type.
 
-1. Focus on the highest priority hypotheses first
-2. Create a production-ready FIS experiment template for each
-3. Save the experiment to the database using insert_experiment
-4. Include both FIS configuration and IAM role configuration
-5. Consider the priority ranking when designing experiments
+1. Skip hypotheses that already have an experiment in the database - design only for those without one
+2. Focus on the highest priority hypotheses first
+3. Create a production-ready FIS experiment template for each
+4. Save the experiment to the database using insert_experiment
+5. Include both FIS configuration and IAM role configuration
+6. Consider the priority ranking when designing experiments
 
 Start with the top 10 highest priority hypotheses.
 """,
-                "output_key": "experiment_designs"
-            },
-            {
-                "name": "fis_setup",
-                "description": "Set up all experiments in AWS FIS",
-                "agent": "src.ExperimentsAgent.agent",
-                "input": f"""
-Set up AWS FIS experiments for the workload:
+        "output_key": "experiment_designs"
+    },
+    {
+        "name": "fis_setup",
+        "timeout_s": 900,
+        "dependencies": ["experiment_design"],
+        "description": "Set up all experiments in AWS FIS",
+        "agent": "src.ExperimentsAgent.agent",
+        "input": """
+Set up AWS FIS experiments (resources are deployed in the {region} region):
 
 1. Get all draft experiments from the database using get_experiments
-2. For each experiment, discover AWS resources and create FIS experiments
+2. For each experiment, discover AWS resources and create a real, executable FIS experiment
 3. Update experiment status to 'created' when successfully set up
-4. I have my app deployed in {region} region
-5. Prioritize setting up experiments based on their hypothesis priority
-
-Focus on creating real, executable FIS experiments in AWS.
+4. Prioritize setup by hypothesis priority
 """,
-                "output_key": "fis_setup_results"
-            },
-            {
-                "name": "experiment_execution",
-                "description": "Execute selected experiments and monitor results",
-                "agent": "src.ExperimentsAgent.agent",
-                "input": f"""
-Execute chaos engineering experiments for the workload:
+        "output_key": "fis_setup_results"
+    },
+    {
+        "name": "experiment_execution",
+        "timeout_s": 3600,
+        "dependencies": ["fis_setup"],
+        "description": "Execute selected experiments and monitor results",
+        "agent": "src.ExperimentsAgent.agent",
+        "input": """
+Execute the prepared experiments:
 
 EXECUTION PLAN:
-1. Get the top {top_experiments} highest priority experiments from the database that have status 'created'
-2. For each experiment:
+1. Get the top {top_experiments} highest priority experiments in ONE get_experiments call (status 'created') - do not fetch them one at a time
+2. Skip any experiment already in a terminal state ('completed', 'failed', 'stopped') - those finished in a previous run and re-running them would repeat the fault injection. Report how many were skipped as already done.
+3. For each remaining experiment:
    a. Display experiment details (name, hypothesis, expected impact)
-   b. Execute the experiment using AWS FIS start_experiment
-   c. Monitor experiment progress with detailed status updates
-   d. Wait for completion (completed, failed, or stopped)
-   e. Capture execution results, duration, and any failure details
-   f. Update database with final status and results
-3. Provide a summary of all executed experiments
+   b. BEFORE calling start_experiment, persist status 'running' with executed_at via update_experiment, so a crash mid-run leaves a record of what was in flight
+   c. Execute the experiment using AWS FIS start_experiment
+   d. Monitor progress by polling ALL in-flight experiments with a single list_experiments call (filtered to running states) every 30 seconds - never poll get_experiment per experiment while running, and back off if FIS throttles
+   e. Wait for completion (completed, failed, or stopped), then call get_experiment once for that experiment to capture its full event log
+   f. Capture execution results, duration, and any failure details
+   g. Update database with final status and results as soon as THIS experiment finishes - do not defer writes to the end of the batch (use update_experiments_status_batch when several experiments share the same final status)
+4. Provide a summary of all executed experiments, including skipped ones
 
 EXECUTION REQUIREMENTS:
-- Execute experiments sequentially (one at a time)
-- Wait for each experiment to complete before starting the next
+- Run up to {max_parallel_experiments} experiments concurrently, but ONLY when their FIS target resources do not overlap - if two experiments share any target resource ARN, run them one after the other
+- Before starting a batch, verify the combined blast radius is acceptable
+- Wait for every experiment in a batch to reach a terminal state before starting the next batch
 - Capture detailed execution logs and timing information
 - Update database status throughout the process
 - Handle any execution failures gracefully
-- Provide clear status updates for each step
 
 SAFETY MEASURES:
 - Verify experiment targets before execution
 - Monitor for any unexpected behavior
 - Capture stop reasons if experiments are terminated
 - Log all AWS FIS API responses
-
-Execute experiments safely and provide detailed progress updates.
 """,
-                "output_key": "execution_results"
-            },
-            {
-                "name": "results_analysis",
-                "description": "Analyze experiment results and generate insights",
-                "agent": "src.LearningAndIterationAgent.agent",
-                "input": """
-Analyze and summarize the results of executed chaos engineering experiments:
+        "output_key": "execution_results"
+    },
+    {
+        "name": "results_analysis",
+        "timeout_s": 600,
+        "dependencies": ["experiment_execution"],
+        "description": "Analyze experiment results and generate insights",
+        "agent": "src.LearningAndIterationAgent.agent",
+        "input": """
+Analyze the results of the executed experiments:
 
 ANALYSIS TASKS:
-1. Get all experiments from the database with status 'completed', 'failed', or 'stopped'
-2. For each executed experiment:
+1. Get all executed experiments in ONE call: get_experiments with status_filter 'completed,failed,stopped' - do not query per experiment
+2. Fetch recent insights in ONE get_learning_history call and skip any experiment that already has insights recorded for its current result - unchanged experiments were analyzed in a previous run; only analyze newly terminal or re-executed experiments
+3. For each remaining experiment:
    a. Display experiment name and hypothesis
    b. Show execution status and duration
    c. Analyze any failure patterns or unexpected behaviors
    d. Extract key learnings and insights
-3. Provide overall summary of chaos engineering results
-4. Recommend next steps based on findings
+4. Provide overall summary of chaos engineering results, including reused insights
+5. Recommend next steps based on findings
 
 REPORTING FORMAT:
 - Clear experiment-by-experiment breakdown
@@ -189,32 +186,159 @@ REPORTING FORMAT:
 - Recommendations for system improvements
 - Suggestions for follow-up experiments
 
-Focus on actionable insights that can improve system resilience.
+Keep every insight actionable.
 """,
-                "output_key": "insights"
-            }
+        "output_key": "insights"
+    }
+)
+
+def _validate_template(template):
+    """
+    Check the workflow plan once at import so a malformed step fails
+    the module load, not minute thirty of a chaos run.
+    """
+    required_keys = ('name', 'timeout_s', 'dependencies', 'description', 'agent', 'input', 'output_key')
+    seen = set()
+    for step in template:
+        missing = [key for key in required_keys if key not in step]
+        if missing:
+            raise ValueError(f"Workflow step {step.get('name', '?')!r} missing keys: {missing}")
+        if step['name'] in seen:
+            raise ValueError(f"Duplicate workflow step name: {step['name']!r}")
+        for dep in step['dependencies']:
+            if dep not in seen:
+                raise ValueError(
+                    f"Step {step['name']!r} depends on {dep!r}, which is not defined before it"
+                )
+        # A dry-run render surfaces placeholder typos immediately
+        step['input'].format(
+            workload_repo='', region='', top_experiments=0, max_parallel_experiments=0
+        )
+        seen.add(step['name'])
+
+_validate_template(_CHAOS_WORKFLOW_TEMPLATE)
+
+@functools.lru_cache(maxsize=32)
+def _render_inputs(workload_repo, region, top_experiments, max_parallel_experiments):
+    """
+    Render the per-step input prompts for one parameter combination.
+
+    The same few combinations recur in a long-lived process, so the
+    kilobytes of formatted prompt text are cached as an immutable tuple
+    of strings; the step dicts themselves are built fresh per call since
+    the workflow runtime may annotate them.
+    """
+    return tuple(
+        step["input"].format(
+            workload_repo=workload_repo,
+            region=region,
+            top_experiments=top_experiments,
+            max_parallel_experiments=max_parallel_experiments
+        )
+        for step in _CHAOS_WORKFLOW_TEMPLATE
+    )
+
+def _prepare_run(workload_repo, region, tags, top_experiments, max_parallel_experiments=1):
+    """
+    Resolve run parameters and render the workflow steps and coordinator
+    prompt. Shared by the blocking and streaming entry points.
+    """
+    # Use centralized region configuration if not provided
+    if region is None:
+        region = get_aws_region()
+    
+    # Set workload tags if provided
+    if tags:
+        set_workload_tags_from_string(tags)
+    
+    # Get workflow logger
+    logger = get_logger("workflow")
+    logger.info("Starting chaos engineering workflow", extra={
+        'workload_repo': workload_repo,
+        'region': region,
+        'tags': tags,
+        'top_experiments': top_experiments,
+        'max_parallel_experiments': max_parallel_experiments
+    })
+    
+    # Set default workload if not provided
+    if not workload_repo:
+        workload_repo = "https://github.com/aws-containers/retail-store-sample-app.git"
+    
+    # Render the per-run inputs into the static step template. The same
+    # run parameters also travel on each step as structured values, so
+    # the workflow runtime and tools can read the exact numbers
+    # programmatically instead of re-parsing them out of prompt text.
+    run_params = {
+        'workload_repo': workload_repo,
+        'region': region,
+        'top_experiments': top_experiments,
+        'max_parallel_experiments': max_parallel_experiments
+    }
+    rendered_inputs = _render_inputs(
+        workload_repo, region, top_experiments, max_parallel_experiments
+    )
+    chaos_workflow = [
+        dict(step, params=run_params, input=rendered)
+        for step, rendered in zip(_CHAOS_WORKFLOW_TEMPLATE, rendered_inputs)
     ]
     
-    # Execute the workflow
-    result = workflow_agent(
-        f"""
-        Execute a complete chaos engineering workflow for the workload at {workload_repo}.
-        The workflow should analyze the application architecture, generate and prioritize hypotheses,
-        design and execute experiments using AWS FIS, and provide actionable insights for improving resilience.
-        
-        Follow these steps in sequence:
-        1. Generate hypotheses from the workload repository
-        2. Prioritize hypotheses based on impact and feasibility
-        3. Create experiments for prioritized hypotheses
-        4. Set up all experiments in AWS FIS (region: {region})
-        5. Execute selected experiments (top {top_experiments})
-        6. Review experiment results and generate insights
-        """, 
-        workflow_steps=chaos_workflow
+    # The step list already carries names, descriptions, dependencies and
+    # full per-step instructions, so the coordinator needs a directive,
+    # not a prose recap of the same plan
+    prompt = (
+        f"Execute the chaos engineering workflow defined in workflow_steps "
+        f"for the workload at {workload_repo}, respecting each step's "
+        f"dependencies."
     )
     
+    return region, prompt, chaos_workflow
+
+def run_chaos_workflow(workload_repo=None, region=None, tags=None, top_experiments=3, verbose=False, max_parallel_experiments=1):
+    """
+    Execute the complete chaos engineering workflow using the workflow pattern.
+    
+    Args:
+        workload_repo (str, optional): Repository URL for the workload to analyze.
+                                      Defaults to AWS Retail Store Sample App.
+        region (str, optional): AWS region where resources are deployed. If None, uses centralized config.
+        tags (str, optional): Tag string for resource filtering.
+                             Format: "Environment=prod,Application=web-app"
+        top_experiments (int, optional): Number of top priority experiments to execute. Defaults to 3.
+        verbose (bool, optional): Enable verbose logging. Defaults to False.
+        max_parallel_experiments (int, optional): How many non-conflicting experiments
+                                                  may run in AWS FIS at once. Defaults to 1
+                                                  (strictly sequential, the safest setting).
+    
+    Returns:
+        dict: The workflow results including all outputs from each step
+    """
+    region, prompt, chaos_workflow = _prepare_run(workload_repo, region, tags, top_experiments, max_parallel_experiments)
+    
+    # Execute the workflow
+    workflow_agent = _get_workflow_agent(get_default_model(), region)
+    result = workflow_agent(prompt, workflow_steps=chaos_workflow)
+    
     return result
 
+async def run_chaos_workflow_stream(workload_repo=None, region=None, tags=None, top_experiments=3, max_parallel_experiments=1):
+    """
+    Streaming variant of run_chaos_workflow.
+
+    Yields the coordinator agent's events as they happen instead of
+    blocking until all six steps finish, so a CLI or UI can show
+    progress during a multi-minute chaos run and cancel it early.
+    Takes the same arguments as run_chaos_workflow.
+
+    Yields:
+        dict: Agent stream events; the final event carries the result.
+    """
+    region, prompt, chaos_workflow = _prepare_run(workload_repo, region, tags, top_experiments, max_parallel_experiments)
+    
+    workflow_agent = _get_workflow_agent(get_default_model(), region)
+    async for event in workflow_agent.stream_async(prompt, workflow_steps=chaos_workflow):
+        yield event
+
 if __name__ == "__main__":
     # Example usage
     run_chaos_workflow()